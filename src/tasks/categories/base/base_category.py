@@ -38,6 +38,10 @@ class BaseCategory(BaseCategoryInterface):
             all_tasks.update(level_tasks)
         return all_tasks
 
+    def has_task_type(self, task_type: str) -> bool:
+        """Check whether the task type is registered at any level without merging the registry."""
+        return any(task_type in level_tasks for level_tasks in self._task_registry.values())
+
     def get_evaluators(self) -> Any:
         """Return the evaluators object for this category."""
         return self._evaluators
@@ -49,8 +53,7 @@ class BaseCategory(BaseCategoryInterface):
     def validate_task_config(self, task_type: str, config: Dict[str, Any]) -> bool:
         """Validate if the given config is valid for the specified task type."""
         # Default implementation - can be overridden by specific categories
-        task_types = self.get_task_types()
-        return task_type in task_types
+        return self.has_task_type(task_type)
 
     def get_default_config(self, task_type: str) -> Dict[str, Any]:
         """Return default configuration for the specified task type."""
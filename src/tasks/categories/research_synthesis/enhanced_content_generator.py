@@ -3,503 +3,609 @@ Enhanced Content Generator for Information Synthesis & Presentation tasks.
 Provides domain-based content generation with professional HTML templates.
 """
 
+import functools
 import random
-from typing import Dict, Any
-from datetime import datetime, timedelta
+import string
+from typing import Dict, Any, Iterable, List, Tuple
+from datetime import date
 
 
-class SimplifiedContentGenerator:
-    """Enhanced content generator with domain-based variability and professional HTML templates."""
+# Domain data with realistic business information
+_DOMAINS = {
+    "technology": {
+        "companies": (
+            "TechFlow",
+            "DataCorp",
+            "InnovateAI",
+            "CodeCraft",
+            "ByteStream",
+            "CloudTech",
+            "DevTools Pro",
+            "SmartCode",
+            "TechVision",
+            "DigitalEdge",
+            "CyberSoft",
+            "NetLogic",
+            "SystemCore",
+            "DataMind",
+            "TechForge",
+            "CodeWorks",
+            "DigitalPro",
+            "InfoTech",
+            "SoftLine",
+            "TechBase",
+            "DataFlow",
+            "CloudCore",
+            "WebTech",
+            "CodeLab",
+            "TechSuite",
+        ),
+        "price_range": (99, 1999),
+        "founded_range": (1995, 2015),
+        "products": (
+            "Software Platform",
+            "Mobile App",
+            "AI Tool",
+            "Cloud Service",
+            "Development Framework",
+            "Data Analytics Suite",
+            "Security Software",
+            "Project Management Tool",
+            "API Gateway",
+            "Machine Learning Platform",
+        ),
+        "colors": ("#2563eb", "#1e40af", "#3730a3"),  # Blue tones
+    },
+    "healthcare": {
+        "companies": (
+            "MedCare",
+            "HealthTech",
+            "WellnessPlus",
+            "CareLink",
+            "MedFlow",
+            "HealthCore",
+            "MedSoft",
+            "CareSystem",
+            "HealthPro",
+            "MedNet",
+            "WellCare",
+            "HealthLink",
+            "MedBase",
+            "CareFlow",
+            "HealthSuite",
+            "MedLab",
+            "CarePoint",
+            "HealthEdge",
+            "MedSync",
+            "CareTrack",
+            "HealthVision",
+            "MedCore",
+            "CareLogic",
+            "HealthForge",
+            "MedTech Pro",
+        ),
+        "price_range": (29, 299),
+        "founded_range": (1985, 2010),
+        "products": (
+            "Health Monitor",
+            "Medical Device",
+            "Wellness App",
+            "Patient Portal",
+            "Telemedicine Platform",
+            "Health Tracker",
+            "Medical Software",
+            "Diagnostic Tool",
+            "Health Analytics",
+            "Patient Management System",
+        ),
+        "colors": ("#059669", "#047857", "#065f46"),  # Green tones
+    },
+    "finance": {
+        "companies": (
+            "FinTech Pro",
+            "MoneyFlow",
+            "CreditCore",
+            "PayLink",
+            "FinBase",
+            "BankTech",
+            "PayFlow",
+            "FinSoft",
+            "MoneyTech",
+            "CreditPro",
+            "FinCore",
+            "PaySystem",
+            "MoneyCore",
+            "FinLogic",
+            "BankFlow",
+            "PayTech",
+            "FinEdge",
+            "MoneyLink",
+            "CreditFlow",
+            "PayCore",
+            "FinSuite",
+            "BankPro",
+            "MoneyNet",
+            "CreditTech",
+            "PayLogic",
+        ),
+        "price_range": (199, 2999),
+        "founded_range": (1990, 2010),
+        "products": (
+            "Trading Platform",
+            "Payment Gateway",
+            "Financial Analytics",
+            "Investment Tool",
+            "Banking Software",
+            "Credit Management",
+            "Risk Assessment Tool",
+            "Portfolio Tracker",
+            "Accounting Software",
+            "Financial Dashboard",
+        ),
+        "colors": ("#dc2626", "#b91c1c", "#991b1b"),  # Red tones
+    },
+    "education": {
+        "companies": (
+            "EduTech",
+            "LearnFlow",
+            "StudyPro",
+            "EduCore",
+            "LearnLink",
+            "StudyTech",
+            "EduSoft",
+            "LearnPro",
+            "StudyFlow",
+            "EduNet",
+            "LearnCore",
+            "StudyLink",
+            "EduLogic",
+            "LearnTech",
+            "StudyBase",
+            "EduFlow",
+            "LearnSoft",
+            "StudyCore",
+            "EduEdge",
+            "LearnBase",
+            "StudyNet",
+            "EduPro",
+            "LearnLogic",
+            "StudyEdge",
+            "EduSuite",
+        ),
+        "price_range": (49, 499),
+        "founded_range": (1988, 2012),
+        "products": (
+            "Learning Platform",
+            "Study App",
+            "Course Management System",
+            "Student Portal",
+            "Educational Software",
+            "Virtual Classroom",
+            "Assessment Tool",
+            "Learning Analytics",
+            "Study Tracker",
+            "Educational Content Platform",
+        ),
+        "colors": ("#7c3aed", "#6d28d9", "#5b21b6"),  # Purple tones
+    },
+    "retail": {
+        "companies": (
+            "ShopTech",
+            "RetailPro",
+            "StoreFlow",
+            "SaleTech",
+            "ShopCore",
+            "RetailFlow",
+            "StorePro",
+            "SaleCore",
+            "ShopLink",
+            "RetailNet",
+            "StoreCore",
+            "SaleFlow",
+            "ShopLogic",
+            "RetailBase",
+            "StoreTech",
+            "SaleLink",
+            "ShopEdge",
+            "RetailLogic",
+            "StoreLink",
+            "SalePro",
+            "ShopNet",
+            "RetailCore",
+            "StoreSoft",
+            "SaleEdge",
+            "ShopSuite",
+        ),
+        "price_range": (19, 199),
+        "founded_range": (1992, 2015),
+        "products": (
+            "E-commerce Platform",
+            "POS System",
+            "Inventory Management",
+            "Customer Portal",
+            "Sales Analytics",
+            "Product Catalog",
+            "Order Management",
+            "Retail Software",
+            "Store Management",
+            "Customer Relationship Tool",
+        ),
+        "colors": ("#ea580c", "#dc2626", "#b91c1c"),  # Orange/Red tones
+    },
+    "manufacturing": {
+        "companies": (
+            "ManuTech",
+            "ProducePro",
+            "FactoryFlow",
+            "MakeCore",
+            "BuildTech",
+            "ManuFlow",
+            "ProduceTech",
+            "FactoryPro",
+            "MakeFlow",
+            "BuildCore",
+            "ManuCore",
+            "ProduceFlow",
+            "FactoryCore",
+            "MakeTech",
+            "BuildFlow",
+            "ManuPro",
+            "ProduceCore",
+            "FactoryTech",
+            "MakeLink",
+            "BuildPro",
+            "ManuLink",
+            "ProduceLink",
+            "FactoryLink",
+            "MakeNet",
+            "BuildNet",
+        ),
+        "price_range": (499, 4999),
+        "founded_range": (1980, 2005),
+        "products": (
+            "Production Software",
+            "Quality Control System",
+            "Supply Chain Tool",
+            "Manufacturing Platform",
+            "Process Management",
+            "Factory Analytics",
+            "Equipment Monitor",
+            "Production Tracker",
+            "Quality Assurance Tool",
+            "Manufacturing Dashboard",
+        ),
+        "colors": ("#6b7280", "#4b5563", "#374151"),  # Gray tones
+    },
+    "food_beverage": {
+        "companies": (
+            "FoodTech",
+            "BeveragePro",
+            "TasteFlow",
+            "FreshCore",
+            "FlavorTech",
+            "FoodFlow",
+            "BeverageFlow",
+            "TastePro",
+            "FreshFlow",
+            "FlavorCore",
+            "FoodCore",
+            "BeverageCore",
+            "TasteCore",
+            "FreshTech",
+            "FlavorFlow",
+            "FoodPro",
+            "BeverageTech",
+            "TasteLink",
+            "FreshPro",
+            "FlavorPro",
+            "FoodLink",
+            "BeverageLink",
+            "TasteTech",
+            "FreshLink",
+            "FlavorLink",
+        ),
+        "price_range": (9, 89),
+        "founded_range": (1995, 2018),
+        "products": (
+            "Recipe Management",
+            "Nutrition Tracker",
+            "Food Safety System",
+            "Menu Planning Tool",
+            "Inventory System",
+            "Quality Control",
+            "Restaurant POS",
+            "Food Analytics",
+            "Delivery Platform",
+            "Nutrition Software",
+        ),
+        "colors": ("#16a34a", "#15803d", "#166534"),  # Green tones
+    },
+    "professional_services": {
+        "companies": (
+            "ServicePro",
+            "ConsultTech",
+            "ProFlow",
+            "ServiceCore",
+            "ConsultPro",
+            "ProTech",
+            "ServiceFlow",
+            "ConsultCore",
+            "ProCore",
+            "ServiceTech",
+            "ConsultFlow",
+            "ProLink",
+            "ServiceLink",
+            "ConsultLink",
+            "ProNet",
+            "ServiceNet",
+            "ConsultNet",
+            "ProBase",
+            "ServiceBase",
+            "ConsultBase",
+            "ProLogic",
+            "ServiceLogic",
+            "ConsultLogic",
+            "ProEdge",
+            "ServiceEdge",
+        ),
+        "price_range": (99, 999),
+        "founded_range": (1985, 2012),
+        "products": (
+            "Consulting Platform",
+            "Project Management",
+            "Client Portal",
+            "Service Management",
+            "Professional Tools",
+            "Business Analytics",
+            "Client Relationship System",
+            "Service Tracking",
+            "Professional Dashboard",
+            "Business Intelligence Tool",
+        ),
+        "colors": ("#0891b2", "#0e7490", "#155e75"),  # Cyan tones
+    },
+}
 
-    def __init__(self):
-        self.random = random.Random()
 
-        # Domain data with realistic business information
-        self.domains = {
-            "technology": {
-                "companies": [
-                    "TechFlow",
-                    "DataCorp",
-                    "InnovateAI",
-                    "CodeCraft",
-                    "ByteStream",
-                    "CloudTech",
-                    "DevTools Pro",
-                    "SmartCode",
-                    "TechVision",
-                    "DigitalEdge",
-                    "CyberSoft",
-                    "NetLogic",
-                    "SystemCore",
-                    "DataMind",
-                    "TechForge",
-                    "CodeWorks",
-                    "DigitalPro",
-                    "InfoTech",
-                    "SoftLine",
-                    "TechBase",
-                    "DataFlow",
-                    "CloudCore",
-                    "WebTech",
-                    "CodeLab",
-                    "TechSuite",
-                ],
-                "price_range": (99, 1999),
-                "founded_range": (1995, 2015),
-                "products": [
-                    "Software Platform",
-                    "Mobile App",
-                    "AI Tool",
-                    "Cloud Service",
-                    "Development Framework",
-                    "Data Analytics Suite",
-                    "Security Software",
-                    "Project Management Tool",
-                    "API Gateway",
-                    "Machine Learning Platform",
-                ],
-                "colors": ["#2563eb", "#1e40af", "#3730a3"],  # Blue tones
-            },
-            "healthcare": {
-                "companies": [
-                    "MedCare",
-                    "HealthTech",
-                    "WellnessPlus",
-                    "CareLink",
-                    "MedFlow",
-                    "HealthCore",
-                    "MedSoft",
-                    "CareSystem",
-                    "HealthPro",
-                    "MedNet",
-                    "WellCare",
-                    "HealthLink",
-                    "MedBase",
-                    "CareFlow",
-                    "HealthSuite",
-                    "MedLab",
-                    "CarePoint",
-                    "HealthEdge",
-                    "MedSync",
-                    "CareTrack",
-                    "HealthVision",
-                    "MedCore",
-                    "CareLogic",
-                    "HealthForge",
-                    "MedTech Pro",
-                ],
-                "price_range": (29, 299),
-                "founded_range": (1985, 2010),
-                "products": [
-                    "Health Monitor",
-                    "Medical Device",
-                    "Wellness App",
-                    "Patient Portal",
-                    "Telemedicine Platform",
-                    "Health Tracker",
-                    "Medical Software",
-                    "Diagnostic Tool",
-                    "Health Analytics",
-                    "Patient Management System",
-                ],
-                "colors": ["#059669", "#047857", "#065f46"],  # Green tones
-            },
-            "finance": {
-                "companies": [
-                    "FinTech Pro",
-                    "MoneyFlow",
-                    "CreditCore",
-                    "PayLink",
-                    "FinBase",
-                    "BankTech",
-                    "PayFlow",
-                    "FinSoft",
-                    "MoneyTech",
-                    "CreditPro",
-                    "FinCore",
-                    "PaySystem",
-                    "MoneyCore",
-                    "FinLogic",
-                    "BankFlow",
-                    "PayTech",
-                    "FinEdge",
-                    "MoneyLink",
-                    "CreditFlow",
-                    "PayCore",
-                    "FinSuite",
-                    "BankPro",
-                    "MoneyNet",
-                    "CreditTech",
-                    "PayLogic",
-                ],
-                "price_range": (199, 2999),
-                "founded_range": (1990, 2010),
-                "products": [
-                    "Trading Platform",
-                    "Payment Gateway",
-                    "Financial Analytics",
-                    "Investment Tool",
-                    "Banking Software",
-                    "Credit Management",
-                    "Risk Assessment Tool",
-                    "Portfolio Tracker",
-                    "Accounting Software",
-                    "Financial Dashboard",
-                ],
-                "colors": ["#dc2626", "#b91c1c", "#991b1b"],  # Red tones
-            },
-            "education": {
-                "companies": [
-                    "EduTech",
-                    "LearnFlow",
-                    "StudyPro",
-                    "EduCore",
-                    "LearnLink",
-                    "StudyTech",
-                    "EduSoft",
-                    "LearnPro",
-                    "StudyFlow",
-                    "EduNet",
-                    "LearnCore",
-                    "StudyLink",
-                    "EduLogic",
-                    "LearnTech",
-                    "StudyBase",
-                    "EduFlow",
-                    "LearnSoft",
-                    "StudyCore",
-                    "EduEdge",
-                    "LearnBase",
-                    "StudyNet",
-                    "EduPro",
-                    "LearnLogic",
-                    "StudyEdge",
-                    "EduSuite",
-                ],
-                "price_range": (49, 499),
-                "founded_range": (1988, 2012),
-                "products": [
-                    "Learning Platform",
-                    "Study App",
-                    "Course Management System",
-                    "Student Portal",
-                    "Educational Software",
-                    "Virtual Classroom",
-                    "Assessment Tool",
-                    "Learning Analytics",
-                    "Study Tracker",
-                    "Educational Content Platform",
-                ],
-                "colors": ["#7c3aed", "#6d28d9", "#5b21b6"],  # Purple tones
-            },
-            "retail": {
-                "companies": [
-                    "ShopTech",
-                    "RetailPro",
-                    "StoreFlow",
-                    "SaleTech",
-                    "ShopCore",
-                    "RetailFlow",
-                    "StorePro",
-                    "SaleCore",
-                    "ShopLink",
-                    "RetailNet",
-                    "StoreCore",
-                    "SaleFlow",
-                    "ShopLogic",
-                    "RetailBase",
-                    "StoreTech",
-                    "SaleLink",
-                    "ShopEdge",
-                    "RetailLogic",
-                    "StoreLink",
-                    "SalePro",
-                    "ShopNet",
-                    "RetailCore",
-                    "StoreSoft",
-                    "SaleEdge",
-                    "ShopSuite",
-                ],
-                "price_range": (19, 199),
-                "founded_range": (1992, 2015),
-                "products": [
-                    "E-commerce Platform",
-                    "POS System",
-                    "Inventory Management",
-                    "Customer Portal",
-                    "Sales Analytics",
-                    "Product Catalog",
-                    "Order Management",
-                    "Retail Software",
-                    "Store Management",
-                    "Customer Relationship Tool",
-                ],
-                "colors": ["#ea580c", "#dc2626", "#b91c1c"],  # Orange/Red tones
-            },
-            "manufacturing": {
-                "companies": [
-                    "ManuTech",
-                    "ProducePro",
-                    "FactoryFlow",
-                    "MakeCore",
-                    "BuildTech",
-                    "ManuFlow",
-                    "ProduceTech",
-                    "FactoryPro",
-                    "MakeFlow",
-                    "BuildCore",
-                    "ManuCore",
-                    "ProduceFlow",
-                    "FactoryCore",
-                    "MakeTech",
-                    "BuildFlow",
-                    "ManuPro",
-                    "ProduceCore",
-                    "FactoryTech",
-                    "MakeLink",
-                    "BuildPro",
-                    "ManuLink",
-                    "ProduceLink",
-                    "FactoryLink",
-                    "MakeNet",
-                    "BuildNet",
-                ],
-                "price_range": (499, 4999),
-                "founded_range": (1980, 2005),
-                "products": [
-                    "Production Software",
-                    "Quality Control System",
-                    "Supply Chain Tool",
-                    "Manufacturing Platform",
-                    "Process Management",
-                    "Factory Analytics",
-                    "Equipment Monitor",
-                    "Production Tracker",
-                    "Quality Assurance Tool",
-                    "Manufacturing Dashboard",
-                ],
-                "colors": ["#6b7280", "#4b5563", "#374151"],  # Gray tones
-            },
-            "food_beverage": {
-                "companies": [
-                    "FoodTech",
-                    "BeveragePro",
-                    "TasteFlow",
-                    "FreshCore",
-                    "FlavorTech",
-                    "FoodFlow",
-                    "BeverageFlow",
-                    "TastePro",
-                    "FreshFlow",
-                    "FlavorCore",
-                    "FoodCore",
-                    "BeverageCore",
-                    "TasteCore",
-                    "FreshTech",
-                    "FlavorFlow",
-                    "FoodPro",
-                    "BeverageTech",
-                    "TasteLink",
-                    "FreshPro",
-                    "FlavorPro",
-                    "FoodLink",
-                    "BeverageLink",
-                    "TasteTech",
-                    "FreshLink",
-                    "FlavorLink",
-                ],
-                "price_range": (9, 89),
-                "founded_range": (1995, 2018),
-                "products": [
-                    "Recipe Management",
-                    "Nutrition Tracker",
-                    "Food Safety System",
-                    "Menu Planning Tool",
-                    "Inventory System",
-                    "Quality Control",
-                    "Restaurant POS",
-                    "Food Analytics",
-                    "Delivery Platform",
-                    "Nutrition Software",
-                ],
-                "colors": ["#16a34a", "#15803d", "#166534"],  # Green tones
-            },
-            "professional_services": {
-                "companies": [
-                    "ServicePro",
-                    "ConsultTech",
-                    "ProFlow",
-                    "ServiceCore",
-                    "ConsultPro",
-                    "ProTech",
-                    "ServiceFlow",
-                    "ConsultCore",
-                    "ProCore",
-                    "ServiceTech",
-                    "ConsultFlow",
-                    "ProLink",
-                    "ServiceLink",
-                    "ConsultLink",
-                    "ProNet",
-                    "ServiceNet",
-                    "ConsultNet",
-                    "ProBase",
-                    "ServiceBase",
-                    "ConsultBase",
-                    "ProLogic",
-                    "ServiceLogic",
-                    "ConsultLogic",
-                    "ProEdge",
-                    "ServiceEdge",
-                ],
-                "price_range": (99, 999),
-                "founded_range": (1985, 2012),
-                "products": [
-                    "Consulting Platform",
-                    "Project Management",
-                    "Client Portal",
-                    "Service Management",
-                    "Professional Tools",
-                    "Business Analytics",
-                    "Client Relationship System",
-                    "Service Tracking",
-                    "Professional Dashboard",
-                    "Business Intelligence Tool",
-                ],
-                "colors": ["#0891b2", "#0e7490", "#155e75"],  # Cyan tones
-            },
-        }
+def _website_slug(name: str) -> str:
+    """Normalize a company name into the host part of its website."""
+    return name.lower().replace(" ", "").replace(",", "")
 
-    def set_seed(self, seed: int):
-        """Set random seed for reproducible generation."""
-        self.random.seed(seed)
 
-    def get_base_css(self, domain: str) -> str:
-        """Get professional CSS styling for the domain."""
-        primary_color = self.random.choice(self.domains[domain]["colors"])
+# Website slugs are fixed per company name, so normalize them once
+_COMPANY_SLUGS = {name: _website_slug(name) for data in _DOMAINS.values() for name in data["companies"]}
+_COMPANY_SUFFIXES = ("Inc", "LLC", "Corp", "Ltd", "Solutions")
+_COMPANY_SUFFIX_SLUGS = {suffix: _website_slug(suffix) for suffix in _COMPANY_SUFFIXES}
+
+# Fixed pools the data generators draw from
+_EMPLOYEE_COUNTS = ("25-50", "50-100", "100-250", "250-500", "500-1000", "1000+")
+_COMPANY_LOCATIONS = (
+    "San Francisco, CA",
+    "New York, NY",
+    "Austin, TX",
+    "Seattle, WA",
+    "Boston, MA",
+    "Denver, CO",
+    "Atlanta, GA",
+    "Chicago, IL",
+    "Los Angeles, CA",
+    "Miami, FL",
+)
+_EVENT_TYPES = {
+    "technology": ("Tech Conference", "Developer Summit", "AI Workshop", "Startup Showcase"),
+    "healthcare": ("Medical Conference", "Health Summit", "Wellness Workshop", "Care Innovation"),
+    "finance": ("Financial Summit", "Investment Conference", "FinTech Expo", "Banking Workshop"),
+    "education": ("Education Conference", "Learning Summit", "Teaching Workshop", "Academic Expo"),
+    "retail": ("Retail Expo", "Commerce Summit", "Sales Conference", "Customer Workshop"),
+    "manufacturing": ("Manufacturing Expo", "Industry Summit", "Production Conference", "Quality Workshop"),
+    "food_beverage": ("Food Expo", "Culinary Summit", "Nutrition Conference", "Taste Workshop"),
+    "professional_services": ("Professional Summit", "Service Expo", "Business Conference", "Client Workshop"),
+}
+_DEFAULT_EVENT_TYPES = ("Industry Conference",)
+_EVENT_VENUES = ("Convention Center", "Hotel Ballroom", "Conference Hall", "Event Center")
+_AREA_CODES = ("555", "415", "212", "713", "206", "617", "303", "404", "312", "310")
+_EMAIL_PREFIXES = ("info", "contact", "support", "hello", "sales", "service")
+_EMAIL_DOMAINS = ("company.com", "business.com", "corp.com", "enterprise.com", "group.com")
+
+# Level 3 document content by domain (max 2 lines, 20 words)
+_DOC_TYPES_BY_DOMAIN = {
+    "technology": (
+        "API Documentation\nComplete technical specifications.",
+        "Product Roadmap\nQuarterly development milestones.",
+        "System Requirements\nMinimum specifications needed.",
+    ),
+    "healthcare": (
+        "Clinical Guidelines\nPatient care standards.",
+        "Health Report\nQuarterly outcome analysis.",
+        "Device Manual\nOperation instructions included.",
+    ),
+    "finance": (
+        "Investment Analysis\nMarket performance review.",
+        "Compliance Report\nRegulatory audit results.",
+        "Risk Guidelines\nAssessment framework outlined.",
+    ),
+    "education": (
+        "Curriculum Guidelines\nLearning objectives defined.",
+        "Performance Report\nStudent achievement metrics.",
+        "Teaching Manual\nInstructional resources provided.",
+    ),
+    "retail": (
+        "Sales Report\nQuarterly revenue analysis.",
+        "Inventory Guide\nStock control procedures.",
+        "Service Manual\nCustomer support standards.",
+    ),
+    "manufacturing": (
+        "Quality Manual\nProduction testing standards.",
+        "Efficiency Report\nOperational performance analysis.",
+        "Safety Manual\nWorkplace protection protocols.",
+    ),
+    "food_beverage": (
+        "Safety Guidelines\nHACCP quality standards.",
+        "Nutrition Report\nHealth content analysis.",
+        "Recipe Manual\nCulinary preparation standards.",
+    ),
+    "professional_services": (
+        "Consulting Guide\nProject delivery framework.",
+        "Engagement Report\nClient satisfaction analysis.",
+        "Development Guide\nSkill enhancement opportunities.",
+    ),
+}
 
-        return f"""
+# Per-domain pieces of level 3 download names, e.g. "FOOD_1234_document.txt" / "Food Beverage Document #1234"
+_DOMAIN_SHORT_CODES = {domain: domain.replace("_", "")[:4].upper() for domain in _DOMAINS}
+_DOMAIN_DOCUMENT_TITLES = {domain: domain.replace("_", " ").title() for domain in _DOMAINS}
+
+# English month names, matching strftime("%B") without the locale lookup
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Difficulty level that renders each content type
+_CONTENT_TYPE_LEVELS = {
+    "company_info": 1,
+    "product_info": 1,
+    "event_info": 1,
+    "product_catalog": 2,
+    "contact_info": 2,
+    "document_repository": 3,
+}
+
+
+# Shared page stylesheet; every use of the domain's primary color is marked by the sentinel
+_CSS_COLOR_SENTINEL = "__PRIMARY_COLOR__"
+_CSS_TEMPLATE = """
         <style>
-            * {{
+            * {
                 margin: 0;
                 padding: 0;
                 box-sizing: border-box;
-            }}
+            }
             
-            body {{
+            body {
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
                 line-height: 1.6;
                 color: #333;
                 background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
                 min-height: 100vh;
                 padding: 20px;
-            }}
+            }
             
-            .container {{
+            .container {
                 max-width: 1200px;
                 margin: 0 auto;
                 background: white;
                 border-radius: 12px;
                 box-shadow: 0 10px 30px rgba(0,0,0,0.1);
                 overflow: hidden;
-            }}
+            }
             
-            .header {{
-                background: linear-gradient(135deg, {primary_color} 0%, {primary_color}dd 100%);
+            .header {
+                background: linear-gradient(135deg, __PRIMARY_COLOR__ 0%, __PRIMARY_COLOR__dd 100%);
                 color: white;
                 padding: 2rem;
                 text-align: center;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 2.5rem;
                 font-weight: 700;
                 margin-bottom: 0.5rem;
                 text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            }}
+            }
             
-            .header .subtitle {{
+            .header .subtitle {
                 font-size: 1.1rem;
                 opacity: 0.9;
                 font-weight: 300;
-            }}
+            }
             
-            .content {{
+            .content {
                 padding: 2rem;
-            }}
+            }
             
-            .card {{
+            .card {
                 background: #f8f9fa;
                 border: 1px solid #e9ecef;
                 border-radius: 8px;
                 padding: 1.5rem;
                 margin: 1rem 0;
                 transition: transform 0.2s ease, box-shadow 0.2s ease;
-            }}
+            }
             
-            .card:hover {{
+            .card:hover {
                 transform: translateY(-2px);
                 box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            }}
+            }
             
-            .highlight {{
-                background: linear-gradient(120deg, {primary_color}22 0%, {primary_color}44 100%);
+            .highlight {
+                background: linear-gradient(120deg, __PRIMARY_COLOR__22 0%, __PRIMARY_COLOR__44 100%);
                 padding: 0.2rem 0.5rem;
                 border-radius: 4px;
                 font-weight: 600;
-                color: {primary_color};
-                border-left: 3px solid {primary_color};
+                color: __PRIMARY_COLOR__;
+                border-left: 3px solid __PRIMARY_COLOR__;
                 padding-left: 0.8rem;
                 display: inline-block;
                 margin: 0.5rem 0;
-            }}
+            }
             
-            .info-grid {{
+            .info-grid {
                 display: grid;
                 grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
                 gap: 1.5rem;
                 margin: 2rem 0;
-            }}
+            }
             
-            .info-item {{
+            .info-item {
                 background: white;
                 border: 1px solid #e9ecef;
                 border-radius: 8px;
                 padding: 1.5rem;
                 text-align: center;
                 transition: all 0.3s ease;
-            }}
+            }
             
-            .info-item:hover {{
-                border-color: {primary_color};
-                box-shadow: 0 0 0 2px {primary_color}22;
-            }}
+            .info-item:hover {
+                border-color: __PRIMARY_COLOR__;
+                box-shadow: 0 0 0 2px __PRIMARY_COLOR__22;
+            }
             
-            .info-label {{
+            .info-label {
                 font-size: 0.9rem;
                 color: #6c757d;
                 text-transform: uppercase;
                 letter-spacing: 0.5px;
                 margin-bottom: 0.5rem;
-            }}
+            }
             
-            .info-value {{
+            .info-value {
                 font-size: 1.5rem;
                 font-weight: 700;
-                color: {primary_color};
-            }}
+                color: __PRIMARY_COLOR__;
+            }
             
-            .footer {{
+            .footer {
                 background: #f8f9fa;
                 padding: 2rem;
                 text-align: center;
                 border-top: 1px solid #e9ecef;
                 color: #6c757d;
-            }}
+            }
             
-            .btn {{
+            .btn {
                 display: inline-block;
-                background: {primary_color};
+                background: __PRIMARY_COLOR__;
                 color: white;
                 padding: 0.75rem 1.5rem;
                 text-decoration: none;
@@ -508,172 +614,100 @@ class SimplifiedContentGenerator:
                 transition: all 0.3s ease;
                 border: none;
                 cursor: pointer;
-            }}
+            }
             
-            .btn:hover {{
-                background: {primary_color}dd;
+            .btn:hover {
+                background: __PRIMARY_COLOR__dd;
                 transform: translateY(-1px);
-                box-shadow: 0 4px 12px {primary_color}44;
-            }}
+                box-shadow: 0 4px 12px __PRIMARY_COLOR__44;
+            }
             
-            .navigation {{
+            .navigation {
                 background: white;
                 padding: 1rem 2rem;
                 border-bottom: 1px solid #e9ecef;
-            }}
+            }
             
-            .nav-links {{
+            .nav-links {
                 display: flex;
                 gap: 2rem;
                 list-style: none;
-            }}
+            }
             
-            .nav-links a {{
+            .nav-links a {
                 color: #6c757d;
                 text-decoration: none;
                 font-weight: 500;
                 padding: 0.5rem 0;
                 border-bottom: 2px solid transparent;
                 transition: all 0.3s ease;
-            }}
+            }
             
-            .nav-links a:hover {{
-                color: {primary_color};
-                border-bottom-color: {primary_color};
-            }}
+            .nav-links a:hover {
+                color: __PRIMARY_COLOR__;
+                border-bottom-color: __PRIMARY_COLOR__;
+            }
         </style>
         """
 
-    def generate_company_data(self, domain: str, seed: int) -> Dict[str, Any]:
-        """Generate realistic company data for the domain."""
-        self.set_seed(seed)
-        domain_data = self.domains[domain]
 
-        # Select company name and add variation
-        company_name = self.random.choice(domain_data["companies"])
-        if self.random.random() < 0.3:  # 30% chance of suffix
-            company_name += f" {self.random.choice(['Inc', 'LLC', 'Corp', 'Ltd', 'Solutions'])}"
+@functools.lru_cache(maxsize=32)
+def _render_css(primary_color: str) -> str:
+    """Render the shared stylesheet for a primary color (cached, since only a handful of colors exist)."""
+    return _CSS_TEMPLATE.replace(_CSS_COLOR_SENTINEL, primary_color)
 
-        # Generate founded year
-        founded_year = self.random.randint(*domain_data["founded_range"])
 
-        # Generate other company details
-        employee_count = self.random.choice(["25-50", "50-100", "100-250", "250-500", "500-1000", "1000+"])
-
-        location = self.random.choice(
-            [
-                "San Francisco, CA",
-                "New York, NY",
-                "Austin, TX",
-                "Seattle, WA",
-                "Boston, MA",
-                "Denver, CO",
-                "Atlanta, GA",
-                "Chicago, IL",
-                "Los Angeles, CA",
-                "Miami, FL",
-            ]
-        )
+def _compile_template(source: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a ``{field}`` template into its static fragments and the field names between them."""
+    fragments, fields = [], []
+    for literal, field, _, _ in string.Formatter().parse(source):
+        fragments.append(literal)
+        if field is not None:
+            fields.append(field)
+    if len(fragments) == len(fields):
+        fragments.append("")
+    return tuple(fragments), tuple(fields)
 
-        return {
-            "name": company_name,
-            "founded": founded_year,
-            "domain": domain,
-            "employees": employee_count,
-            "location": location,
-            "website": f"www.{company_name.lower().replace(' ', '').replace(',', '')}.com",
-        }
 
-    def generate_product_data(self, domain: str, seed: int) -> Dict[str, Any]:
-        """Generate realistic product data for the domain."""
-        self.set_seed(seed + 100)  # Offset seed for variety
-        domain_data = self.domains[domain]
+def _render_template(template: Tuple[Tuple[str, ...], Tuple[str, ...]], values: Dict[str, Any]) -> str:
+    """Fill a compiled template, joining all pieces into the final page in one allocation."""
+    fragments, fields = template
+    parts = [""] * (len(fragments) + len(fields))
+    parts[::2] = fragments
+    parts[1::2] = [str(values[field]) for field in fields]
+    return "".join(parts)
 
-        product_name = self.random.choice(domain_data["products"])
-        price = self.random.randint(*domain_data["price_range"])
 
-        # Format price realistically
-        if price < 100:
-            price_str = f"${price}.99"
+def _bind_template(template: Tuple[Tuple[str, ...], Tuple[str, ...]], bound: Dict[str, str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Partially evaluate a compiled template, folding the ``bound`` fields into its static fragments."""
+    fragments, fields = template
+    bound_fragments, open_fields = [fragments[0]], []
+    for field, fragment in zip(fields, fragments[1:]):
+        if field in bound:
+            bound_fragments[-1] += bound[field] + fragment
         else:
-            price_str = f"${price:,}.00"
+            open_fields.append(field)
+            bound_fragments.append(fragment)
+    return tuple(bound_fragments), tuple(open_fields)
 
-        return {
-            "name": product_name,
-            "price": price_str,
-            "domain": domain,
-            "description": f"Professional {product_name.lower()} designed for modern {domain} needs.",
-            "features": self.random.randint(3, 8),
-        }
 
-    def generate_event_data(self, domain: str, seed: int) -> Dict[str, Any]:
-        """Generate realistic event data for the domain."""
-        self.set_seed(seed + 200)  # Offset seed for variety
-
-        # Generate future date
-        base_date = datetime.now()
-        days_ahead = self.random.randint(30, 365)
-        event_date = base_date + timedelta(days=days_ahead)
-
-        event_types = {
-            "technology": ["Tech Conference", "Developer Summit", "AI Workshop", "Startup Showcase"],
-            "healthcare": ["Medical Conference", "Health Summit", "Wellness Workshop", "Care Innovation"],
-            "finance": ["Financial Summit", "Investment Conference", "FinTech Expo", "Banking Workshop"],
-            "education": ["Education Conference", "Learning Summit", "Teaching Workshop", "Academic Expo"],
-            "retail": ["Retail Expo", "Commerce Summit", "Sales Conference", "Customer Workshop"],
-            "manufacturing": ["Manufacturing Expo", "Industry Summit", "Production Conference", "Quality Workshop"],
-            "food_beverage": ["Food Expo", "Culinary Summit", "Nutrition Conference", "Taste Workshop"],
-            "professional_services": ["Professional Summit", "Service Expo", "Business Conference", "Client Workshop"],
-        }
-
-        event_name = self.random.choice(event_types.get(domain, ["Industry Conference"]))
-
-        return {
-            "name": event_name,
-            "date": event_date.strftime("%B %d, %Y"),
-            "time": f"{self.random.randint(9, 15)}:00 AM",
-            "location": self.random.choice(["Convention Center", "Hotel Ballroom", "Conference Hall", "Event Center"]),
-            "domain": domain,
-        }
-
-    def generate_contact_data(self, domain: str, seed: int) -> Dict[str, Any]:
-        """Generate realistic contact data."""
-        self.set_seed(seed + 300)
+# Page templates, split into fragments once at import
 
-        # Generate phone number
-        area_codes = ["555", "415", "212", "713", "206", "617", "303", "404", "312", "310"]
-        area_code = self.random.choice(area_codes)
-        phone = f"({area_code}) {self.random.randint(100, 999)}-{self.random.randint(1000, 9999)}"
-
-        # Generate email
-        email_prefixes = ["info", "contact", "support", "hello", "sales", "service"]
-        email_prefix = self.random.choice(email_prefixes)
-        email_domain = self.random.choice(["company.com", "business.com", "corp.com", "enterprise.com", "group.com"])
-        email = f"{email_prefix}@{email_domain}"
-
-        return {"phone": phone, "email": email, "domain": domain}
-
-    def generate_level1_content(self, domain: str, content_type: str, seed: int) -> Dict[str, Any]:
-        """Generate Level 1 content with enhanced HTML template."""
-        self.set_seed(seed)
-
-        if content_type == "company_info":
-            company_data = self.generate_company_data(domain, seed)
-            target_text = f"Founded in {company_data['founded']}"
-
-            html_content = f"""<!DOCTYPE html>
+# Level 1 page templates
+_LEVEL1_COMPANY_TEMPLATE = _compile_template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{company_data["name"]} - Company Information</title>
-    {self.get_base_css(domain)}
+    <title>{name} - Company Information</title>
+    {css}
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{company_data["name"]}</h1>
-            <div class="subtitle">Leading {domain.title()} Solutions</div>
+            <h1>{name}</h1>
+            <div class="subtitle">Leading {domain_title} Solutions</div>
         </div>
         
         <nav class="navigation">
@@ -687,7 +721,7 @@ class SimplifiedContentGenerator:
         <div class="content">
             <div class="card">
                 <h2>About Our Company</h2>
-                <p>Welcome to {company_data["name"]}, your trusted partner in {domain} solutions. We have built our reputation on delivering exceptional results and innovative approaches.</p>
+                <p>Welcome to {name}, your trusted partner in {domain} solutions. We have built our reputation on delivering exceptional results and innovative approaches.</p>
                 
                 <div class="info-grid">
                     <div class="info-item">
@@ -696,11 +730,11 @@ class SimplifiedContentGenerator:
                     </div>
                     <div class="info-item">
                         <div class="info-label">Location</div>
-                        <div class="info-value">{company_data["location"]}</div>
+                        <div class="info-value">{location}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Team Size</div>
-                        <div class="info-value">{company_data["employees"]} employees</div>
+                        <div class="info-value">{employees} employees</div>
                     </div>
                 </div>
                 
@@ -709,29 +743,28 @@ class SimplifiedContentGenerator:
         </div>
         
         <div class="footer">
-            <p>Visit us at {company_data["website"]} | © 2024 {company_data["name"]}. All rights reserved.</p>
+            <p>Visit us at {website} | © 2024 {name}. All rights reserved.</p>
         </div>
     </div>
 </body>
 </html>"""
+)
 
-        elif content_type == "product_info":
-            product_data = self.generate_product_data(domain, seed)
-            target_text = f"Price: {product_data['price']}"
 
-            html_content = f"""<!DOCTYPE html>
+_LEVEL1_PRODUCT_TEMPLATE = _compile_template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{product_data["name"]} - Product Details</title>
-    {self.get_base_css(domain)}
+    <title>{name} - Product Details</title>
+    {css}
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{product_data["name"]}</h1>
-            <div class="subtitle">Professional {domain.title()} Solution</div>
+            <h1>{name}</h1>
+            <div class="subtitle">Professional {domain_title} Solution</div>
         </div>
         
         <nav class="navigation">
@@ -745,16 +778,16 @@ class SimplifiedContentGenerator:
         <div class="content">
             <div class="card">
                 <h2>Product Overview</h2>
-                <p>{product_data["description"]}</p>
+                <p>{description}</p>
                 
                 <div class="info-grid">
                     <div class="info-item">
                         <div class="info-label">Features</div>
-                        <div class="info-value">{product_data["features"]}+ powerful features</div>
+                        <div class="info-value">{features}+ powerful features</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Category</div>
-                        <div class="info-value">{domain.title()}</div>
+                        <div class="info-value">{domain_title}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Investment</div>
@@ -776,24 +809,23 @@ class SimplifiedContentGenerator:
     </div>
 </body>
 </html>"""
+)
 
-        elif content_type == "event_info":
-            event_data = self.generate_event_data(domain, seed)
-            target_text = f"Date: {event_data['date']}"
 
-            html_content = f"""<!DOCTYPE html>
+_LEVEL1_EVENT_TEMPLATE = _compile_template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{event_data["name"]} - Event Information</title>
-    {self.get_base_css(domain)}
+    <title>{name} - Event Information</title>
+    {css}
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{event_data["name"]}</h1>
-            <div class="subtitle">Premier {domain.title()} Industry Event</div>
+            <h1>{name}</h1>
+            <div class="subtitle">Premier {domain_title} Industry Event</div>
         </div>
         
         <nav class="navigation">
@@ -816,11 +848,11 @@ class SimplifiedContentGenerator:
                     </div>
                     <div class="info-item">
                         <div class="info-label">Time</div>
-                        <div class="info-value">{event_data["time"]}</div>
+                        <div class="info-value">{time}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Venue</div>
-                        <div class="info-value">{event_data["location"]}</div>
+                        <div class="info-value">{location}</div>
                     </div>
                 </div>
                 
@@ -838,33 +870,23 @@ class SimplifiedContentGenerator:
     </div>
 </body>
 </html>"""
+)
 
-        else:
-            raise ValueError(f"Unknown content type: {content_type}")
-
-        return {"html_content": html_content, "target_text": target_text, "template_type": content_type, "domain": domain}
-
-    def generate_level2_content(self, domain: str, content_type: str, seed: int) -> Dict[str, Any]:
-        """Generate Level 2 content with enhanced HTML template."""
-        self.set_seed(seed)
-
-        if content_type == "product_catalog":
-            product_data = self.generate_product_data(domain, seed)
-            target_texts = [f"Product: {product_data['name']}", f"Price: {product_data['price']}"]
-
-            html_content = f"""<!DOCTYPE html>
+# Level 2 and 3 page templates
+_LEVEL2_CATALOG_TEMPLATE = _compile_template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Product Catalog - {domain.title()} Solutions</title>
-    {self.get_base_css(domain)}
+    <title>Product Catalog - {domain_title} Solutions</title>
+    {css}
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>Featured Products</h1>
-            <div class="subtitle">Professional {domain.title()} Solutions</div>
+            <div class="subtitle">Professional {domain_title} Solutions</div>
         </div>
         
         <nav class="navigation">
@@ -883,19 +905,19 @@ class SimplifiedContentGenerator:
                 <div class="info-grid">
                     <div class="info-item">
                         <div class="info-label">Featured Solution</div>
-                        <div class="highlight">{target_texts[0]}</div>
+                        <div class="highlight">{first_target_text}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Investment</div>
-                        <div class="highlight">{target_texts[1]}</div>
+                        <div class="highlight">{second_target_text}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Features</div>
-                        <div class="info-value">{product_data["features"]}+ capabilities</div>
+                        <div class="info-value">{features}+ capabilities</div>
                     </div>
                 </div>
                 
-                <p>{product_data["description"]} Our solution combines cutting-edge technology with user-friendly design to deliver exceptional results for {domain} professionals.</p>
+                <p>{description} Our solution combines cutting-edge technology with user-friendly design to deliver exceptional results for {domain} professionals.</p>
                 
                 <div style="text-align: center; margin-top: 2rem;">
                     <a href="#details" class="btn">View Full Details</a>
@@ -910,24 +932,22 @@ class SimplifiedContentGenerator:
     </div>
 </body>
 </html>"""
+)
 
-        elif content_type == "contact_info":
-            contact_data = self.generate_contact_data(domain, seed)
-            target_texts = [f"Phone: {contact_data['phone']}", f"Email: {contact_data['email']}"]
-
-            html_content = f"""<!DOCTYPE html>
+_LEVEL2_CONTACT_TEMPLATE = _compile_template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Contact Information - {domain.title()} Support</title>
-    {self.get_base_css(domain)}
+    <title>Contact Information - {domain_title} Support</title>
+    {css}
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>Get In Touch</h1>
-            <div class="subtitle">Professional {domain.title()} Support</div>
+            <div class="subtitle">Professional {domain_title} Support</div>
         </div>
         
         <nav class="navigation">
@@ -946,11 +966,11 @@ class SimplifiedContentGenerator:
                 <div class="info-grid">
                     <div class="info-item">
                         <div class="info-label">Call Us</div>
-                        <div class="highlight">{target_texts[0]}</div>
+                        <div class="highlight">{first_target_text}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Email Us</div>
-                        <div class="highlight">{target_texts[1]}</div>
+                        <div class="highlight">{second_target_text}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Response Time</div>
@@ -961,8 +981,8 @@ class SimplifiedContentGenerator:
                 <p>Our dedicated support team has extensive experience in {domain} solutions and is committed to providing you with prompt, professional assistance.</p>
                 
                 <div style="text-align: center; margin-top: 2rem;">
-                    <a href="tel:{contact_data["phone"]}" class="btn">Call Now</a>
-                    <a href="mailto:{contact_data["email"]}" class="btn" style="margin-left: 1rem;">Send Email</a>
+                    <a href="tel:{phone}" class="btn">Call Now</a>
+                    <a href="mailto:{email}" class="btn" style="margin-left: 1rem;">Send Email</a>
                 </div>
             </div>
         </div>
@@ -973,83 +993,22 @@ class SimplifiedContentGenerator:
     </div>
 </body>
 </html>"""
+)
 
-        else:
-            raise ValueError(f"Unknown content type: {content_type}")
-
-        return {"html_content": html_content, "target_texts": target_texts, "template_type": content_type, "domain": domain}
-
-    def generate_level3_content(self, domain: str, seed: int) -> Dict[str, Any]:
-        """Generate Level 3 content with enhanced HTML template and downloadable files."""
-        self.set_seed(seed)
-
-        # Generate document content based on domain (max 2 lines, 20 words)
-        doc_types = {
-            "technology": [
-                "API Documentation\nComplete technical specifications.",
-                "Product Roadmap\nQuarterly development milestones.",
-                "System Requirements\nMinimum specifications needed.",
-            ],
-            "healthcare": [
-                "Clinical Guidelines\nPatient care standards.",
-                "Health Report\nQuarterly outcome analysis.",
-                "Device Manual\nOperation instructions included.",
-            ],
-            "finance": [
-                "Investment Analysis\nMarket performance review.",
-                "Compliance Report\nRegulatory audit results.",
-                "Risk Guidelines\nAssessment framework outlined.",
-            ],
-            "education": [
-                "Curriculum Guidelines\nLearning objectives defined.",
-                "Performance Report\nStudent achievement metrics.",
-                "Teaching Manual\nInstructional resources provided.",
-            ],
-            "retail": [
-                "Sales Report\nQuarterly revenue analysis.",
-                "Inventory Guide\nStock control procedures.",
-                "Service Manual\nCustomer support standards.",
-            ],
-            "manufacturing": [
-                "Quality Manual\nProduction testing standards.",
-                "Efficiency Report\nOperational performance analysis.",
-                "Safety Manual\nWorkplace protection protocols.",
-            ],
-            "food_beverage": [
-                "Safety Guidelines\nHACCP quality standards.",
-                "Nutrition Report\nHealth content analysis.",
-                "Recipe Manual\nCulinary preparation standards.",
-            ],
-            "professional_services": [
-                "Consulting Guide\nProject delivery framework.",
-                "Engagement Report\nClient satisfaction analysis.",
-                "Development Guide\nSkill enhancement opportunities.",
-            ],
-        }
-
-        # Select document content
-        domain_docs = doc_types.get(domain, doc_types["professional_services"])
-        file_content = self.random.choice(domain_docs)
-
-        # Generate filename
-        doc_number = self.random.randint(1000, 9999)
-        domain_short = domain.replace("_", "")[:4].upper()
-        download_filename = f"{domain_short}_{doc_number}_document.txt"
-        file_description = f"{domain.replace('_', ' ').title()} Document #{doc_number}"
-
-        html_content = f"""<!DOCTYPE html>
+_LEVEL3_DOCUMENT_TEMPLATE = _compile_template(
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Document Repository - {domain.title()} Resources</title>
-    {self.get_base_css(domain)}
+    <title>Document Repository - {domain_title} Resources</title>
+    {css}
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>Document Center</h1>
-            <div class="subtitle">Professional {domain.title()} Resources</div>
+            <div class="subtitle">Professional {domain_title} Resources</div>
         </div>
         
         <nav class="navigation">
@@ -1063,7 +1022,7 @@ class SimplifiedContentGenerator:
         <div class="content">
             <div class="card">
                 <h2>Professional Documentation</h2>
-                <p>Access our comprehensive library of {domain.replace("_", " ")} documentation, guidelines, and professional resources.</p>
+                <p>Access our comprehensive library of {domain_label} documentation, guidelines, and professional resources.</p>
                 
                 <div class="info-grid">
                     <div class="info-item">
@@ -1072,7 +1031,7 @@ class SimplifiedContentGenerator:
                     </div>
                     <div class="info-item">
                         <div class="info-label">Category</div>
-                        <div class="info-value">{domain.title()}</div>
+                        <div class="info-value">{domain_title}</div>
                     </div>
                     <div class="info-item">
                         <div class="info-label">Format</div>
@@ -1086,7 +1045,7 @@ class SimplifiedContentGenerator:
                     </a>
                 </div>
                 
-                <p>This document contains essential information for {domain.replace("_", " ")} professionals and provides detailed guidance on current industry practices and standards.</p>
+                <p>This document contains essential information for {domain_label} professionals and provides detailed guidance on current industry practices and standards.</p>
                 
                 <div class="card" style="background: #f8f9fa; margin-top: 2rem;">
                     <h3>Additional Resources</h3>
@@ -1106,6 +1065,203 @@ class SimplifiedContentGenerator:
     </div>
 </body>
 </html>"""
+)
+
+# Template rendered for each content type
+_PAGE_TEMPLATES = {
+    "company_info": _LEVEL1_COMPANY_TEMPLATE,
+    "product_info": _LEVEL1_PRODUCT_TEMPLATE,
+    "event_info": _LEVEL1_EVENT_TEMPLATE,
+    "product_catalog": _LEVEL2_CATALOG_TEMPLATE,
+    "contact_info": _LEVEL2_CONTACT_TEMPLATE,
+    "document_repository": _LEVEL3_DOCUMENT_TEMPLATE,
+}
+
+# Level 1 content types: data generator method, target text format
+_LEVEL1_PAGES = {
+    "company_info": ("generate_company_data", "Founded in {founded}"),
+    "product_info": ("generate_product_data", "Price: {price}"),
+    "event_info": ("generate_event_data", "Date: {date}"),
+}
+
+# Level 2 content types: data generator method, formats of the two target texts
+_LEVEL2_PAGES = {
+    "product_catalog": ("generate_product_data", ("Product: {name}", "Price: {price}")),
+    "contact_info": ("generate_contact_data", ("Phone: {phone}", "Email: {email}")),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _page_template(content_type: str, domain: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Page template for a content type with its domain-specific fields already folded in."""
+    return _bind_template(
+        _PAGE_TEMPLATES[content_type],
+        {"domain": domain, "domain_title": domain.title(), "domain_label": domain.replace("_", " ")},
+    )
+
+
+class SimplifiedContentGenerator:
+    """Enhanced content generator with domain-based variability and professional HTML templates."""
+
+    domains = _DOMAINS
+
+    def __init__(self):
+        self.random = random.Random()
+
+    def set_seed(self, seed: int):
+        """Set random seed for reproducible generation."""
+        self.random.seed(seed)
+
+    def get_base_css(self, domain: str) -> str:
+        """Get professional CSS styling for the domain."""
+        primary_color = self.random.choice(self.domains[domain]["colors"])
+        return _render_css(primary_color)
+
+    def generate_company_data(self, domain: str, seed: int) -> Dict[str, Any]:
+        """Generate realistic company data for the domain."""
+        self.set_seed(seed)
+        rng = self.random
+        domain_data = self.domains[domain]
+
+        # Select company name and add variation
+        company_name = rng.choice(domain_data["companies"])
+        website_slug = _COMPANY_SLUGS[company_name]
+        if rng.random() < 0.3:  # 30% chance of suffix
+            suffix = rng.choice(_COMPANY_SUFFIXES)
+            company_name += f" {suffix}"
+            website_slug += _COMPANY_SUFFIX_SLUGS[suffix]
+
+        # Generate founded year
+        founded_year = rng.randint(*domain_data["founded_range"])
+
+        # Generate other company details
+        employee_count = rng.choice(_EMPLOYEE_COUNTS)
+        location = rng.choice(_COMPANY_LOCATIONS)
+
+        return {
+            "name": company_name,
+            "founded": founded_year,
+            "domain": domain,
+            "employees": employee_count,
+            "location": location,
+            "website": f"www.{website_slug}.com",
+        }
+
+    def generate_product_data(self, domain: str, seed: int) -> Dict[str, Any]:
+        """Generate realistic product data for the domain."""
+        self.set_seed(seed + 100)  # Offset seed for variety
+        rng = self.random
+        domain_data = self.domains[domain]
+
+        product_name = rng.choice(domain_data["products"])
+        price = rng.randint(*domain_data["price_range"])
+
+        # Format price realistically
+        if price < 100:
+            price_str = f"${price}.99"
+        else:
+            price_str = f"${price:,}.00"
+
+        return {
+            "name": product_name,
+            "price": price_str,
+            "domain": domain,
+            "description": f"Professional {product_name.lower()} designed for modern {domain} needs.",
+            "features": rng.randint(3, 8),
+        }
+
+    def generate_event_data(self, domain: str, seed: int) -> Dict[str, Any]:
+        """Generate realistic event data for the domain."""
+        self.set_seed(seed + 200)  # Offset seed for variety
+        rng = self.random
+
+        # Generate future date
+        days_ahead = rng.randint(30, 365)
+        event_date = date.fromordinal(date.today().toordinal() + days_ahead)
+
+        event_name = rng.choice(_EVENT_TYPES.get(domain, _DEFAULT_EVENT_TYPES))
+
+        return {
+            "name": event_name,
+            "date": f"{_MONTH_NAMES[event_date.month - 1]} {event_date.day:02d}, {event_date.year}",
+            "time": f"{rng.randint(9, 15)}:00 AM",
+            "location": rng.choice(_EVENT_VENUES),
+            "domain": domain,
+        }
+
+    def generate_contact_data(self, domain: str, seed: int) -> Dict[str, Any]:
+        """Generate realistic contact data."""
+        self.set_seed(seed + 300)
+        rng = self.random
+
+        # Generate phone number
+        area_code = rng.choice(_AREA_CODES)
+        phone = f"({area_code}) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+
+        # Generate email
+        email_prefix = rng.choice(_EMAIL_PREFIXES)
+        email_domain = rng.choice(_EMAIL_DOMAINS)
+        email = f"{email_prefix}@{email_domain}"
+
+        return {"phone": phone, "email": email, "domain": domain}
+
+    def generate_level1_content(self, domain: str, content_type: str, seed: int) -> Dict[str, Any]:
+        """Generate Level 1 content with enhanced HTML template."""
+        page = _LEVEL1_PAGES.get(content_type)
+        if page is None:
+            raise ValueError(f"Unknown content type: {content_type}")
+        data_generator, target_format = page
+
+        # The data generator reseeds from ``seed`` before its first draw, so no page-level reseed is needed
+        page_data = getattr(self, data_generator)(domain, seed)
+        target_text = target_format.format_map(page_data)
+        html_content = _render_template(
+            _page_template(content_type, domain),
+            {**page_data, "css": self.get_base_css(domain), "target_text": target_text},
+        )
+
+        return {"html_content": html_content, "target_text": target_text, "template_type": content_type, "domain": domain}
+
+    def generate_level2_content(self, domain: str, content_type: str, seed: int) -> Dict[str, Any]:
+        """Generate Level 2 content with enhanced HTML template."""
+        page = _LEVEL2_PAGES.get(content_type)
+        if page is None:
+            raise ValueError(f"Unknown content type: {content_type}")
+        data_generator, target_formats = page
+
+        # The data generator reseeds from ``seed`` before its first draw, so no page-level reseed is needed
+        page_data = getattr(self, data_generator)(domain, seed)
+        target_texts = [target_format.format_map(page_data) for target_format in target_formats]
+        html_content = _render_template(
+            _page_template(content_type, domain),
+            {
+                **page_data,
+                "css": self.get_base_css(domain),
+                "first_target_text": target_texts[0],
+                "second_target_text": target_texts[1],
+            },
+        )
+
+        return {"html_content": html_content, "target_texts": target_texts, "template_type": content_type, "domain": domain}
+
+    def generate_level3_content(self, domain: str, seed: int) -> Dict[str, Any]:
+        """Generate Level 3 content with enhanced HTML template and downloadable files."""
+        self.set_seed(seed)
+        rng = self.random
+
+        # Select document content
+        domain_docs = _DOC_TYPES_BY_DOMAIN.get(domain, _DOC_TYPES_BY_DOMAIN["professional_services"])
+        file_content = rng.choice(domain_docs)
+
+        # Generate filename
+        doc_number = rng.randint(1000, 9999)
+        download_filename = f"{_DOMAIN_SHORT_CODES[domain]}_{doc_number}_document.txt"
+        file_description = f"{_DOMAIN_DOCUMENT_TITLES[domain]} Document #{doc_number}"
+
+        html_content = _render_template(
+            _page_template("document_repository", domain),
+            {"css": self.get_base_css(domain), "file_description": file_description, "download_filename": download_filename},
+        )
 
         return {
             "html_content": html_content,
@@ -1115,3 +1271,19 @@ class SimplifiedContentGenerator:
             "template_type": "document_repository",
             "domain": domain,
         }
+
+    def generate_batch(self, domain: str, content_type: str, seeds: Iterable[int]) -> List[Dict[str, Any]]:
+        """Generate content for many seeds at once, resolving the domain and level a single time.
+
+        Each entry is identical to what the matching generate_levelN_content call returns for that seed.
+        """
+        if domain not in self.domains:
+            raise ValueError(f"Unknown domain: {domain}")
+        level = _CONTENT_TYPE_LEVELS.get(content_type)
+        if level is None:
+            raise ValueError(f"Unknown content type: {content_type}")
+
+        if level == 3:
+            return [self.generate_level3_content(domain, seed) for seed in seeds]
+        generate = self.generate_level1_content if level == 1 else self.generate_level2_content
+        return [generate(domain, content_type, seed) for seed in seeds]
@@ -3,7 +3,44 @@ Evaluator configuration logic for Information Synthesis & Presentation category.
 Contains the logic for building multi-evaluator configurations, not running evaluations.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+SUPPORTED_TASK_TYPES = frozenset(
+    {
+        "basic_web_extraction",
+        "multi_point_summary",
+        "file_download_integration",
+    }
+)
+
+
+def _postconfig() -> List[Dict[str, Any]]:
+    """Build the steps run after the episode so the presentation is saved before it is collected."""
+    return [
+        {
+            "type": "activate_window",
+            "parameters": {
+                "window_name": "LibreOffice Impress",
+                "strict": False,
+            },
+        },
+        {
+            "type": "execute",
+            "parameters": {
+                "command": [
+                    "python3",
+                    "-c",
+                    "import pyautogui; pyautogui.hotkey('ctrl', 's');",
+                ]
+            },
+        },
+        {"type": "sleep", "parameters": {"seconds": 2}},
+    ]
+
+
+_OPTIONS = {
+    "text_threshold": 0.8,
+}
 
 
 class ResearchSynthesisEvaluators:
@@ -32,144 +69,23 @@ class ResearchSynthesisEvaluators:
         Returns:
             Multi-evaluator configuration
         """
-        if task_type == "basic_web_extraction":
-            return self._build_level1_evaluator(task_data, files_created, s3_urls)
-        elif task_type == "multi_point_summary":
-            return self._build_level2_evaluator(task_data, files_created, s3_urls)
-        elif task_type == "file_download_integration":
-            return self._build_level3_evaluator(task_data, files_created, s3_urls)
-        else:
+        # All three levels are evaluated the same way: the saved presentation against the expected spec
+        if task_type not in SUPPORTED_TASK_TYPES:
             raise ValueError(f"Unknown task type: {task_type}")
+        return self._build_evaluator(task_data, files_created, s3_urls)
 
-    def _build_level1_evaluator(
-        self,
-        task_data: Dict[str, Any],
-        files_created: Dict[str, str],
-        s3_urls: Dict[str, str] = None,
-    ) -> Dict[str, Any]:
-        """Build evaluator for Level 1: basic_web_extraction task."""
-        presentation_file = task_data["presentation_file"]
-        presentation_path = f"/home/user/Documents/{presentation_file}"
-
-        config = {
-            "postconfig": [
-                {
-                    "type": "activate_window",
-                    "parameters": {
-                        "window_name": "LibreOffice Impress",
-                        "strict": False,
-                    },
-                },
-                {
-                    "type": "execute",
-                    "parameters": {
-                        "command": [
-                            "python3",
-                            "-c",
-                            "import pyautogui; pyautogui.hotkey('ctrl', 's');",
-                        ]
-                    },
-                },
-                {"type": "sleep", "parameters": {"seconds": 2}},
-            ],
-            "func": "evaluate_presentation_against_spec",
-            "result": {
-                "type": "vm_file",
-                "path": presentation_path,
-                "dest": "result_presentation.pptx",
-            },
-            "expected": {
-                "type": "cloud_file",
-                "path": s3_urls.get("gold_standard_url", ""),
-                "dest": "expected_presentation.json",
-            },
-            "options": {
-                "text_threshold": 0.8,
-            },
-        }
-
-        return config
-
-    def _build_level2_evaluator(
-        self,
-        task_data: Dict[str, Any],
-        files_created: Dict[str, str],
-        s3_urls: Dict[str, str] = None,
-    ) -> Dict[str, Any]:
-        """Build evaluator for Level 2: multi_point_summary task."""
-        presentation_file = task_data["presentation_file"]
-        presentation_path = f"/home/user/Documents/{presentation_file}"
-
-        config = {
-            "postconfig": [
-                {
-                    "type": "activate_window",
-                    "parameters": {
-                        "window_name": "LibreOffice Impress",
-                        "strict": False,
-                    },
-                },
-                {
-                    "type": "execute",
-                    "parameters": {
-                        "command": [
-                            "python3",
-                            "-c",
-                            "import pyautogui; pyautogui.hotkey('ctrl', 's');",
-                        ]
-                    },
-                },
-                {"type": "sleep", "parameters": {"seconds": 2}},
-            ],
-            "func": "evaluate_presentation_against_spec",
-            "result": {
-                "type": "vm_file",
-                "path": presentation_path,
-                "dest": "result_presentation.pptx",
-            },
-            "expected": {
-                "type": "cloud_file",
-                "path": s3_urls.get("gold_standard_url", ""),
-                "dest": "expected_presentation.json",
-            },
-            "options": {
-                "text_threshold": 0.8,
-            },
-        }
-
-        return config
-
-    def _build_level3_evaluator(
+    def _build_evaluator(
         self,
         task_data: Dict[str, Any],
         files_created: Dict[str, str],
         s3_urls: Dict[str, str] = None,
     ) -> Dict[str, Any]:
-        """Build evaluator for Level 3: file_download_integration task."""
+        """Build the presentation-against-spec evaluator shared by all research synthesis tasks."""
         presentation_file = task_data["presentation_file"]
         presentation_path = f"/home/user/Documents/{presentation_file}"
 
         config = {
-            "postconfig": [
-                {
-                    "type": "activate_window",
-                    "parameters": {
-                        "window_name": "LibreOffice Impress",
-                        "strict": False,
-                    },
-                },
-                {
-                    "type": "execute",
-                    "parameters": {
-                        "command": [
-                            "python3",
-                            "-c",
-                            "import pyautogui; pyautogui.hotkey('ctrl', 's');",
-                        ]
-                    },
-                },
-                {"type": "sleep", "parameters": {"seconds": 2}},
-            ],
+            "postconfig": _postconfig(),
             "func": "evaluate_presentation_against_spec",
             "result": {
                 "type": "vm_file",
@@ -181,9 +97,7 @@ class ResearchSynthesisEvaluators:
                 "path": s3_urls.get("gold_standard_url", ""),
                 "dest": "expected_presentation.json",
             },
-            "options": {
-                "text_threshold": 0.8,
-            },
+            "options": dict(_OPTIONS),
         }
 
         return config
@@ -199,9 +113,4 @@ class ResearchSynthesisEvaluators:
         Returns:
             True if multi-evaluator needed, False otherwise
         """
-        supported_types = {
-            "basic_web_extraction",
-            "multi_point_summary",
-            "file_download_integration",
-        }
-        return task_type in supported_types
+        return task_type in SUPPORTED_TASK_TYPES
@@ -4,6 +4,7 @@ Handles file placement, directory creation, setup configuration, and evaluation
 """
 
 import os
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from ..base import (
@@ -11,7 +12,20 @@ from ..base import (
     ConfigProviderInterface,
     EvaluationProviderInterface,
 )
-from .evaluators import ResearchSynthesisEvaluators
+from .evaluators import SUPPORTED_TASK_TYPES, ResearchSynthesisEvaluators
+from .setup_steps import (
+    application_settle_step,
+    application_steps,
+    chrome_launch_step,
+    http_server_step,
+    mkdir_files_step,
+    server_ready_step,
+)
+from .tasks.base_task import BaseResearchSynthesisTaskGenerator
+
+# VM directories task files are placed in
+_DESKTOP_PREFIX = "/home/user/Desktop/"
+_TMP_PREFIX = "/tmp/"
 
 
 class ResearchSynthesisFileProvider(FileProviderInterface):
@@ -26,8 +40,7 @@ class ResearchSynthesisFileProvider(FileProviderInterface):
         webpage_filename = task_data["webpage_filename"]
         webpage_content = task_data["webpage_content"]
         filepath = os.path.join(temp_dir, webpage_filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(webpage_content)
+        Path(filepath).write_bytes(webpage_content.encode("utf-8"))
         return filepath
 
     def create_additional_files(self, task_data: Dict[str, Any], task_id: str, temp_dir: str) -> Dict[str, Dict[str, str]]:
@@ -39,8 +52,7 @@ class ResearchSynthesisFileProvider(FileProviderInterface):
             files_dir = os.path.join(temp_dir, "files")
             os.makedirs(files_dir, exist_ok=True)
             filepath = os.path.join(files_dir, download_filename)
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(file_content)
+            Path(filepath).write_bytes(file_content.encode("utf-8"))
             additional_files[download_filename] = {
                 "local_path": filepath,
                 "filename": download_filename,
@@ -56,8 +68,6 @@ class ResearchSynthesisFileProvider(FileProviderInterface):
         evaluation_mode: str,
     ) -> Optional[str]:
         """Create expected presentation specification JSON file for evaluation."""
-        from .tasks.base_task import BaseResearchSynthesisTaskGenerator
-
         temp_generator = BaseResearchSynthesisTaskGenerator(task_data["task_type"], task_data["level"])
         expected_filepath = temp_generator.create_expected_spec(task_data, temp_dir)
         return expected_filepath
@@ -68,12 +78,7 @@ class ResearchSynthesisFileProvider(FileProviderInterface):
 
     def supports_task_type(self, task_type: str) -> bool:
         """Check if this provider supports the given task type."""
-        supported_types = {
-            "basic_web_extraction",
-            "multi_point_summary",
-            "file_download_integration",
-        }
-        return task_type in supported_types
+        return task_type in SUPPORTED_TASK_TYPES
 
     def create_task_files(self, task_data: Dict[str, Any], task_id: str, temp_dir: str) -> Dict[str, str]:
         """Create all task files for the given task."""
@@ -96,9 +101,8 @@ class ResearchSynthesisFileProvider(FileProviderInterface):
     def get_file_placement_path(self, task_type: str, filename: str) -> str:
         """Get the file placement path for a given task type and filename."""
         if filename.endswith(".pptx"):
-            return f"/home/user/Desktop/{filename}"
-        else:
-            return f"/tmp/{filename}"
+            return _DESKTOP_PREFIX + filename
+        return _TMP_PREFIX + filename
 
 
 class ResearchSynthesisConfigProvider(ConfigProviderInterface):
@@ -106,11 +110,7 @@ class ResearchSynthesisConfigProvider(ConfigProviderInterface):
 
     def __init__(self):
         """Initialize config provider."""
-        self.supported_tasks = {
-            "basic_web_extraction",
-            "multi_point_summary",
-            "file_download_integration",
-        }
+        self.supported_tasks = SUPPORTED_TASK_TYPES
         self.evaluation_mode_mapping = {
             "basic_web_extraction": "multi_evaluator",
             "multi_point_summary": "multi_evaluator",
@@ -128,70 +128,30 @@ class ResearchSynthesisConfigProvider(ConfigProviderInterface):
         level = task_data.get("level", 1)
         if not self.supports_task_type(task_type):
             return []
+        webpage_filename = task_data["webpage_filename"]
         steps = []
+        downloads = []
         if "main_file" in s3_urls:
-            steps.append(
+            downloads.append({"url": s3_urls["main_file"], "path": f"/tmp/{webpage_filename}"})
+        if level == 3 and "additional_files" in s3_urls:
+            additional_downloads = [
                 {
-                    "type": "download",
-                    "parameters": {
-                        "files": [
-                            {
-                                "url": s3_urls["main_file"],
-                                "path": f"/tmp/{task_data['webpage_filename']}",
-                            }
-                        ]
-                    },
+                    "url": file_info["url"],
+                    "path": f"/tmp/files/{file_info['filename']}",
                 }
-            )
-        if level == 3 and "additional_files" in s3_urls:
-            additional_downloads = []
-            for orig_filename, file_info in s3_urls["additional_files"].items():
-                additional_downloads.append(
-                    {
-                        "url": file_info["url"],
-                        "path": f"/tmp/files/{file_info['filename']}",
-                    }
-                )
+                for file_info in s3_urls["additional_files"].values()
+            ]
             if additional_downloads:
-                steps.append(
-                    {
-                        "type": "command",
-                        "parameters": {"command": ["mkdir", "-p", "/tmp/files"]},
-                    }
-                )
-                steps.append({"type": "download", "parameters": {"files": additional_downloads}})
-        steps.append(
-            {
-                "type": "execute",
-                "parameters": {
-                    "command": [
-                        "python3",
-                        "-c",
-                        "import subprocess, os; "
-                        "log=open('/tmp/http_server.log','a'); "
-                        "p=subprocess.Popen(['python3','-m','http.server','8080','--directory','/tmp'], stdout=log, stderr=log, preexec_fn=os.setsid); "
-                        "open('/tmp/http_server.pid','w').write(str(p.pid)); "
-                        "print('Server started on port 8080')",
-                    ]
-                },
-            }
-        )
-        steps.append({"type": "sleep", "parameters": {"seconds": 2}})
-        target_url = f"http://localhost:8080/{task_data['webpage_filename']}"
-        steps.append(
-            {
-                "type": "launch",
-                "parameters": {"command": ["google-chrome", "--new-window", target_url]},
-            }
-        )
-        steps.append({"type": "launch", "parameters": {"command": ["libreoffice", "--impress"]}})
-        steps.append(
-            {
-                "type": "activate_window",
-                "parameters": {"window_name": "Google Chrome", "strict": False},
-            }
-        )
-        steps.append({"type": "sleep", "parameters": {"seconds": 10.0}})
+                steps.append(mkdir_files_step())
+                downloads.extend(additional_downloads)
+        if downloads:
+            # One download step for all files lets the executor fetch them together
+            steps.append({"type": "download", "parameters": {"files": downloads}})
+        steps.append(http_server_step())
+        steps.append(server_ready_step())
+        steps.append(chrome_launch_step(f"http://localhost:8080/{webpage_filename}"))
+        steps.extend(application_steps())
+        steps.append(application_settle_step())
         return steps
 
     def get_evaluation_mode(self, task_type: str, level: int) -> str:
@@ -208,11 +168,7 @@ class ResearchSynthesisEvaluationProvider(EvaluationProviderInterface):
 
     def __init__(self):
         """Initialize evaluation provider."""
-        self.supported_tasks = {
-            "basic_web_extraction",
-            "multi_point_summary",
-            "file_download_integration",
-        }
+        self.supported_tasks = SUPPORTED_TASK_TYPES
         self.evaluators = ResearchSynthesisEvaluators()
 
     def build_evaluator_config(
@@ -5,6 +5,14 @@ Contains the logic for building setup configuration steps for tasks.
 
 from typing import Dict, Any, List
 
+from .setup_steps import (
+    application_steps,
+    chrome_launch_step,
+    http_server_step,
+    mkdir_files_step,
+    server_ready_step,
+)
+
 
 class ResearchSynthesisSetupConfig:
     """Configuration builder for task setup steps in the Information Synthesis & Presentation category."""
@@ -34,84 +42,45 @@ class ResearchSynthesisSetupConfig:
         level = task_example.get("level", 1)
         webpage_filename = task_example["webpage_filename"]
 
-        # Step 1: Download main HTML file
+        # Step 1: Collect every file to fetch so the executor receives one batched download
+        downloads = []
         if "main_file" in s3_urls:
-            steps.append(
+            downloads.append(
                 {
-                    "type": "download",
-                    "parameters": {
-                        "files": [
-                            {
-                                "url": s3_urls["main_file"],
-                                "path": f"/tmp/{webpage_filename}",
-                            }
-                        ]
-                    },
+                    "url": s3_urls["main_file"],
+                    "path": f"/tmp/{webpage_filename}",
                 }
             )
 
-        # Step 2: For Level 3, download additional files (downloadable content)
+        # Step 2: For Level 3, add the additional files (downloadable content)
         if level == 3 and "additional_files" in s3_urls:
-            additional_downloads = []
-            for orig_filename, file_info in s3_urls["additional_files"].items():
-                additional_downloads.append(
-                    {
-                        "url": file_info["url"],
-                        "path": f"/tmp/files/{file_info['filename']}",
-                    }
-                )
+            additional_downloads = [
+                {
+                    "url": file_info["url"],
+                    "path": f"/tmp/files/{file_info['filename']}",
+                }
+                for file_info in s3_urls["additional_files"].values()
+            ]
 
             if additional_downloads:
-                # Create files directory first
-                steps.append(
-                    {
-                        "type": "command",
-                        "parameters": {"command": ["mkdir", "-p", "/tmp/files"]},
-                    }
-                )
+                # Create files directory before the batched download runs
+                steps.append(mkdir_files_step())
+                downloads.extend(additional_downloads)
 
-                # Download additional files
-                steps.append({"type": "download", "parameters": {"files": additional_downloads}})
+        if downloads:
+            steps.append({"type": "download", "parameters": {"files": downloads}})
 
         # Step 3: Start local HTTP server for serving files (detached background process)
-        steps.append(
-            {
-                "type": "execute",
-                "parameters": {
-                    "command": [
-                        "python3",
-                        "-c",
-                        "import subprocess, os; "
-                        "log=open('/tmp/http_server.log','a'); "
-                        "p=subprocess.Popen(['python3','-m','http.server','8080','--directory','/tmp'], stdout=log, stderr=log, preexec_fn=os.setsid); "
-                        "open('/tmp/http_server.pid','w').write(str(p.pid)); "
-                        "print('Server started on port 8080')",
-                    ]
-                },
-            }
-        )
+        steps.append(http_server_step())
 
         # Step 4: Wait for server to start
-        steps.append({"type": "sleep", "parameters": {"seconds": 2}})
+        steps.append(server_ready_step())
 
         # Step 5: Launch Chrome with target webpage
-        target_url = f"http://localhost:8080/{webpage_filename}"
-        steps.append(
-            {
-                "type": "launch",
-                "parameters": {"command": ["google-chrome", "--new-window", target_url]},
-            }
-        )
-
-        # Step 6: Launch LibreOffice Impress
-        steps.append({"type": "launch", "parameters": {"command": ["libreoffice", "--impress"]}})
-
-        # Step 7: Activate Chrome window to start with focus on browser
-        steps.append(
-            {
-                "type": "activate_window",
-                "parameters": {"window_name": "Google Chrome", "strict": False},
-            }
-        )
+        steps.append(chrome_launch_step(f"http://localhost:8080/{webpage_filename}"))
+
+        # Step 6: Launch LibreOffice Impress, then activate Chrome so the task starts with focus on the browser.
+        # Unlike the config provider, no settle sleep follows here.
+        steps.extend(application_steps())
 
         return steps
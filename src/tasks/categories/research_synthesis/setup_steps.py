@@ -0,0 +1,78 @@
+"""
+Setup steps shared by the research synthesis setup builders.
+Both the config provider and the setup config build their step lists from these definitions.
+Each function returns a new step, so a returned config can be edited without affecting others.
+"""
+
+from typing import Dict, Any, List
+
+_HTTP_SERVER_SCRIPT = (
+    "setsid python3 -m http.server 8080 --directory /tmp >>/tmp/http_server.log 2>&1 </dev/null & "
+    "echo $! > /tmp/http_server.pid; "
+    "echo 'Server started on port 8080'"
+)
+# Wait until the HTTP server accepts connections on port 8080, and exit non-zero if it has not
+# bound within 2s so a failed server start surfaces as a failed setup step. The probe is Python
+# rather than a shell loop because the VM's sh has no portable TCP check (no /dev/tcp in dash,
+# nc/curl are not guaranteed), while python3 is always present since it runs the server itself.
+_SERVER_READY_SCRIPT = (
+    "import socket, time\n"
+    "deadline = time.monotonic() + 2\n"
+    "while time.monotonic() < deadline:\n"
+    "    try:\n"
+    "        socket.create_connection(('127.0.0.1', 8080), timeout=0.05).close()\n"
+    "        break\n"
+    "    except OSError:\n"
+    "        time.sleep(0.02)\n"
+    "else:\n"
+    "    raise SystemExit('HTTP server did not accept connections on port 8080 within 2s')\n"
+)
+CHROME_LAUNCH_ARGS = ("google-chrome", "--new-window")
+
+
+def mkdir_files_step() -> Dict[str, Any]:
+    """Build the step that creates the directory for downloadable files."""
+    return {
+        "type": "command",
+        "parameters": {"command": ["mkdir", "-p", "/tmp/files"]},
+    }
+
+
+def http_server_step() -> Dict[str, Any]:
+    """Build the step that starts the detached HTTP server serving /tmp."""
+    return {
+        "type": "execute",
+        "parameters": {"command": ["sh", "-c", _HTTP_SERVER_SCRIPT]},
+    }
+
+
+def server_ready_step() -> Dict[str, Any]:
+    """Build the step that waits for the HTTP server to accept connections."""
+    return {
+        "type": "execute",
+        "parameters": {"command": ["python3", "-c", _SERVER_READY_SCRIPT]},
+    }
+
+
+def chrome_launch_step(target_url: str) -> Dict[str, Any]:
+    """Build the step that opens the target webpage in a new Chrome window."""
+    return {
+        "type": "launch",
+        "parameters": {"command": [*CHROME_LAUNCH_ARGS, target_url]},
+    }
+
+
+def application_steps() -> List[Dict[str, Any]]:
+    """Build the steps after the Chrome launch: open Impress and bring Chrome to the front."""
+    return [
+        {"type": "launch", "parameters": {"command": ["libreoffice", "--impress"]}},
+        {
+            "type": "activate_window",
+            "parameters": {"window_name": "Google Chrome", "strict": False},
+        },
+    ]
+
+
+def application_settle_step() -> Dict[str, Any]:
+    """Build the pause that lets Chrome and Impress settle before the task starts."""
+    return {"type": "sleep", "parameters": {"seconds": 10.0}}
@@ -1,12 +1,14 @@
 """Task implementations for Information Synthesis & Presentation category."""
 
-from .level1_tasks import BasicWebExtractionGenerator
-from .level2_tasks import MultiPointSummaryGenerator
-from .level3_tasks import FileDownloadIntegrationGenerator
+import threading
 
 # Task registry for this category
 TASK_GENERATORS = {}
 
+# Guards registry loading against concurrent workers
+_REGISTRY_LOCK = threading.Lock()
+_generators_loaded = False
+
 
 def register_generator(task_type: str, generator_class):
     """Register a task generator."""
@@ -29,12 +31,27 @@ def get_all_generators():
 
 def _ensure_generators_loaded():
     """Ensure all generators are loaded and registered."""
-    if not TASK_GENERATORS:
+    global _generators_loaded
+    if _generators_loaded:
+        return
+    with _REGISTRY_LOCK:
+        if _generators_loaded:
+            return
+
         # Level 1 tasks
+        from .level1_tasks import BasicWebExtractionGenerator
+
         register_generator("basic_web_extraction", BasicWebExtractionGenerator)
 
         # Level 2 tasks
+        from .level2_tasks import MultiPointSummaryGenerator
+
         register_generator("multi_point_summary", MultiPointSummaryGenerator)
 
         # Level 3 tasks
+        from .level3_tasks import FileDownloadIntegrationGenerator
+
         register_generator("file_download_integration", FileDownloadIntegrationGenerator)
+
+        # Only publish once every level is registered so other threads never see a partial registry
+        _generators_loaded = True
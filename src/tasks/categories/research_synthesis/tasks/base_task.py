@@ -6,32 +6,43 @@ import random
 import string
 import os
 import json
-from typing import Dict, Any, Optional
-from pptx import Presentation
-from pptx.util import Inches
+from typing import Dict, Any, Optional, Tuple
 
 from ...base import BaseTask
 from ..enhanced_content_generator import SimplifiedContentGenerator
 
+try:
+    import orjson
+
+    def _dump_spec(spec: Dict[str, Any]) -> bytes:
+        """Serialize an expected-presentation spec to indented UTF-8 JSON."""
+        return orjson.dumps(spec, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _dump_spec(spec: Dict[str, Any]) -> bytes:
+        """Serialize an expected-presentation spec to indented UTF-8 JSON."""
+        return json.dumps(spec, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class BaseResearchSynthesisTaskGenerator(BaseTask):
     """Base class for Information Synthesis & Presentation task implementations."""
 
+    # Available domains for content generation
+    domains = tuple(SimplifiedContentGenerator.domains)
+
+    # Content types by level
+    content_types = {1: ("company_info", "product_info", "event_info"), 2: ("product_catalog", "contact_info"), 3: ("document_repository",)}
+
     def __init__(self, task_type: str, level: int):
         super().__init__()
         self.task_type = task_type
         self.level = level
         self.random = random.Random()
 
-        # Initialize enhanced content generator
+        # Initialize enhanced content generator (per instance, since it owns a seeded RNG)
         self.content_generator = SimplifiedContentGenerator()
 
-        # Available domains for content generation
-        self.domains = list(self.content_generator.domains.keys())
-
-        # Content types by level
-        self.content_types = {1: ["company_info", "product_info", "event_info"], 2: ["product_catalog", "contact_info"], 3: ["document_repository"]}
-
     def set_seed(self, seed: int):
         """Set random seed for reproducible generation."""
         self.random.seed(seed)
@@ -45,6 +56,45 @@ class BaseResearchSynthesisTaskGenerator(BaseTask):
         """Generate dynamic task data."""
         return self.generate_basic_task_structure(seed)
 
+    def generate_level_content(self, seed: Optional[int] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Generate the basic task structure and the level's webpage data for a seed."""
+        task_data = self.generate_basic_task_structure(seed)
+        webpage_data = self.generate_webpage_content(self.level, seed)
+        return task_data, webpage_data
+
+    def build_level_task_data(
+        self,
+        task_data: Dict[str, Any],
+        webpage_data: Dict[str, Any],
+        content_fields: Dict[str, Any],
+        instructions: str,
+        evaluation_data: Dict[str, Any],
+        extra_urls: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Complete a level task from its generated content and the level-specific fields."""
+        webpage_filename = f"webpage_{task_data['seed']}.html"
+        html_content = webpage_data["html_content"]
+
+        task_data.update(
+            {
+                "webpage_filename": webpage_filename,
+                "webpage_content": html_content,
+                **content_fields,
+                "template_type": webpage_data["template_type"],
+                "domain": webpage_data.get("domain", "professional_services"),
+                "instructions": instructions,
+                "target_url": f"http://localhost:8080/{webpage_filename}",
+                **(extra_urls or {}),
+                "evaluation_data": evaluation_data,
+                # Required by framework validation
+                "broken_file_content": html_content,
+                "correct_file_content": html_content,
+                "evaluation_method": "multi_evaluator",
+            }
+        )
+
+        return task_data
+
     def get_task_type(self) -> str:
         """Return the task type identifier."""
         return self.task_type
@@ -77,7 +127,7 @@ class BaseResearchSynthesisTaskGenerator(BaseTask):
 
         # Select domain and content type
         domain = self.random.choice(self.domains)
-        available_content_types = self.content_types.get(level, [])
+        available_content_types = self.content_types.get(level, ())
 
         if not available_content_types:
             raise ValueError(f"No content types available for level {level}")
@@ -96,6 +146,10 @@ class BaseResearchSynthesisTaskGenerator(BaseTask):
 
     def create_expected_presentation(self, task_data: Dict[str, Any], temp_dir: str) -> str:
         """Create expected presentation file for evaluation."""
+        # python-pptx is only needed here, so keep it (and lxml) out of module import
+        from pptx import Presentation
+        from pptx.util import Inches
+
         prs = Presentation()
 
         if self.level == 1:
@@ -150,8 +204,8 @@ class BaseResearchSynthesisTaskGenerator(BaseTask):
         filename = f"expected_{presentation_base}.json"
         filepath = os.path.join(temp_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(spec, f, indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(_dump_spec(spec))
 
         return filepath
 
@@ -160,13 +214,16 @@ class BaseResearchSynthesisTaskGenerator(BaseTask):
         if seed is not None:
             self.set_seed(seed)
 
+        task_seed = seed or self.random.randint(1, 10000)
+        # One filename serves both the task-facing and framework-facing fields
+        presentation_file = self.generate_presentation_filename()
         return {
             "task_type": self.task_type,
             "level": self.level,
             "category": "research_synthesis",
-            "seed": seed or self.random.randint(1, 10000),
-            "presentation_file": self.generate_presentation_filename(),
+            "seed": task_seed,
+            "presentation_file": presentation_file,
             "evaluation_mode": "multi_evaluator",
             "example_id": f"L{self.level}_{self.task_type}_{self.random.randint(1, 1000)}",
-            "file_name": self.generate_presentation_filename(),  # Required by framework
+            "file_name": presentation_file,  # Required by framework
         }
@@ -14,41 +14,22 @@ class MultiPointSummaryGenerator(BaseResearchSynthesisTaskGenerator):
 
     def generate_task_data(self, seed: Optional[int] = None) -> Dict[str, Any]:
         """Generate dynamic multi-point summary task."""
-        task_data = self.generate_basic_task_structure(seed)
-
-        # Generate webpage content for Level 2
-        webpage_data = self.generate_webpage_content(2, seed)
-
-        # Generate webpage filename
-        webpage_filename = f"webpage_{task_data['seed']}.html"
-
-        # Create collaborative instructions
-        instructions = self._generate_collaborative_instructions(task_data["presentation_file"], webpage_data["target_texts"], webpage_data["template_type"])
-
-        task_data.update(
-            {
-                "webpage_filename": webpage_filename,
-                "webpage_content": webpage_data["html_content"],
-                "target_texts": webpage_data["target_texts"],
-                "expected_texts": webpage_data["target_texts"],
-                "template_type": webpage_data["template_type"],
-                "domain": webpage_data.get("domain", "professional_services"),
-                "instructions": instructions,
-                "target_url": f"http://localhost:8080/{webpage_filename}",
-                "evaluation_data": {
-                    "target_texts": webpage_data["target_texts"],
-                    "presentation_file": task_data["presentation_file"],
-                    "expected_slide_count": 2,
-                },
-                # Required by framework validation
-                "broken_file_content": webpage_data["html_content"],
-                "correct_file_content": webpage_data["html_content"],
-                "evaluation_method": "multi_evaluator",
-            }
+        task_data, webpage_data = self.generate_level_content(seed)
+        presentation_file = task_data["presentation_file"]
+        target_texts = webpage_data["target_texts"]
+
+        return self.build_level_task_data(
+            task_data,
+            webpage_data,
+            content_fields={"target_texts": target_texts, "expected_texts": target_texts},
+            instructions=self._generate_collaborative_instructions(presentation_file, target_texts, webpage_data["template_type"]),
+            evaluation_data={
+                "target_texts": target_texts,
+                "presentation_file": presentation_file,
+                "expected_slide_count": 2,
+            },
         )
 
-        return task_data
-
     def _generate_collaborative_instructions(self, presentation_file: str, target_texts: list, template_type: str = None) -> str:
         """Generate collaborative instructions for Level 2 tasks."""
         # Create task-specific questions based on target text types and template
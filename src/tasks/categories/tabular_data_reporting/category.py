@@ -18,6 +18,16 @@ from .providers import (
     TabularDataReportingEvaluationProvider,
 )
 
+# Level of each data analysis task type
+_TASK_LEVELS = {
+    # Level 1 task
+    "simple_data_transfer": 1,
+    # Level 2 task
+    "basic_data_aggregation": 2,
+    # Level 3 task
+    "simple_calculation_output": 3,
+}
+
 
 class TabularDataReportingCategory(BaseCategory):
     """Tabular Data Reporting category implementation."""
@@ -39,21 +49,10 @@ class TabularDataReportingCategory(BaseCategory):
         # Get all task implementations and register them with their levels
         all_tasks = get_all_generators()
 
-        # Level mapping for data analysis tasks
-        level_mapping = {
-            # Level 1 task
-            "simple_data_transfer": 1,
-            # Level 2 task
-            "basic_data_aggregation": 2,
-            # Level 3 task
-            "simple_calculation_output": 3,
-        }
-
         # Register tasks with their appropriate levels
         for task_type, task_impl in all_tasks.items():
-            if task_type in level_mapping:
-                level = level_mapping[task_type]
-                self.register_task(task_type, type(task_impl), level)
+            if task_type in _TASK_LEVELS:
+                self.register_task(task_type, type(task_impl), _TASK_LEVELS[task_type])
 
     def get_supported_levels(self) -> List[int]:
         """Return list of supported levels for this category."""
@@ -66,8 +65,7 @@ class TabularDataReportingCategory(BaseCategory):
     def validate_task_config(self, task_type: str, config: Dict[str, Any]) -> bool:
         """Validate if the given config is valid for the specified task type."""
         # Check if task type exists
-        task_types = self.get_task_types()
-        if task_type not in task_types:
+        if not self.has_task_type(task_type):
             return False
 
         # Basic config validation
@@ -76,20 +74,12 @@ class TabularDataReportingCategory(BaseCategory):
 
     def get_default_config(self, task_type: str) -> Dict[str, Any]:
         """Return default configuration for the specified task type."""
-        task_types = self.get_task_types()
-        if task_type not in task_types:
+        if not self.has_task_type(task_type):
             return {}
 
-        # Get the level for this task type
-        level_mapping = {
-            "simple_data_transfer": 1,
-            "basic_data_aggregation": 2,
-            "simple_calculation_output": 3,
-        }
-
         return {
             "task_type": task_type,
-            "level": level_mapping.get(task_type, 1),
+            "level": _TASK_LEVELS.get(task_type, 1),
             "category": self.get_category_name(),
         }
 
@@ -3,7 +3,27 @@ Evaluator configuration logic for tabular data reporting category.
 Contains the logic for building evaluator configurations, not running evaluations.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+SUPPORTED_TASK_TYPES = frozenset(
+    {
+        "simple_data_transfer",
+        "basic_data_aggregation",
+        "simple_calculation_output",
+    }
+)
+
+# Evaluator builder method for each task type
+_EVALUATOR_BUILDERS = {
+    "simple_data_transfer": "_build_level1_evaluator",
+    "basic_data_aggregation": "_build_level2_evaluator",
+    "simple_calculation_output": "_build_level3_evaluator",
+}
+
+
+def _postconfig() -> List[Dict[str, Any]]:
+    """Build the wait after the episode before the result spreadsheet is collected."""
+    return [{"type": "sleep", "parameters": {"seconds": 2.0}}]
 
 
 class TabularDataReportingEvaluators:
@@ -32,14 +52,10 @@ class TabularDataReportingEvaluators:
         Returns:
             Single evaluator configuration
         """
-        if task_type == "simple_data_transfer":
-            return self._build_level1_evaluator(task_data, files_created, s3_urls)
-        elif task_type == "basic_data_aggregation":
-            return self._build_level2_evaluator(task_data, files_created, s3_urls)
-        elif task_type == "simple_calculation_output":
-            return self._build_level3_evaluator(task_data, files_created, s3_urls)
-        else:
+        builder = _EVALUATOR_BUILDERS.get(task_type)
+        if builder is None:
             raise ValueError(f"Unknown task type: {task_type}")
+        return getattr(self, builder)(task_data, files_created, s3_urls)
 
     def _build_level1_evaluator(
         self,
@@ -48,38 +64,7 @@ class TabularDataReportingEvaluators:
         s3_urls: Dict[str, str] = None,
     ) -> Dict[str, Any]:
         """Build evaluator for Level 1: Simple Data Transfer."""
-        evaluation_data = task_data["evaluation_data"]
-
-        return {
-            "postconfig": [{"type": "sleep", "parameters": {"seconds": 2.0}}],
-            "func": "compare_table",
-            "result": {
-                "type": "vm_file",
-                "path": "/home/user/Desktop/result.xlsx",
-                "dest": "result.xlsx",
-            },
-            "expected": {
-                "type": "cloud_file",
-                "path": s3_urls["expected_spreadsheet"] if s3_urls else "",
-                "dest": "expected_result.xlsx",
-            },
-            "options": {
-                "debug": True,
-                "rules": [
-                    {
-                        "type": "check_cell",
-                        "sheet_idx": 0,
-                        "coordinate": evaluation_data["target_cell"],
-                        "props": {
-                            "value": {
-                                "method": "eq",
-                                "ref": evaluation_data["expected_value"],
-                            }
-                        },
-                    }
-                ],
-            },
-        }
+        return self._build_check_cell_evaluator(task_data["evaluation_data"], s3_urls, "eq")
 
     def _build_level2_evaluator(
         self,
@@ -88,10 +73,17 @@ class TabularDataReportingEvaluators:
         s3_urls: Dict[str, str] = None,
     ) -> Dict[str, Any]:
         """Build evaluator for Level 2: Basic Data Aggregation."""
-        evaluation_data = task_data["evaluation_data"]
+        return self._build_check_cell_evaluator(task_data["evaluation_data"], s3_urls, "approx:0.01")
 
+    def _build_check_cell_evaluator(
+        self,
+        evaluation_data: Dict[str, Any],
+        s3_urls: Dict[str, str],
+        method: str,
+    ) -> Dict[str, Any]:
+        """Build a result.xlsx check_cell evaluator comparing the target cell with the given method."""
         return {
-            "postconfig": [{"type": "sleep", "parameters": {"seconds": 2.0}}],
+            "postconfig": _postconfig(),
             "func": "compare_table",
             "result": {
                 "type": "vm_file",
@@ -112,7 +104,7 @@ class TabularDataReportingEvaluators:
                         "coordinate": evaluation_data["target_cell"],
                         "props": {
                             "value": {
-                                "method": "approx:0.01",
+                                "method": method,
                                 "ref": evaluation_data["expected_value"],
                             }
                         },
@@ -131,7 +123,7 @@ class TabularDataReportingEvaluators:
         evaluation_data = task_data["evaluation_data"]
 
         return {
-            "postconfig": [{"type": "sleep", "parameters": {"seconds": 2.0}}],
+            "postconfig": _postconfig(),
             "func": ["compare_table", "exact_match"],
             "result": [
                 {
@@ -4,6 +4,9 @@ Handles file placement, directory creation, setup configuration, and evaluation
 """
 
 import os
+from itertools import zip_longest
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
 from ..base import (
@@ -11,7 +14,76 @@ from ..base import (
     ConfigProviderInterface,
     EvaluationProviderInterface,
 )
-from .evaluators import TabularDataReportingEvaluators
+from .evaluators import SUPPORTED_TASK_TYPES, TabularDataReportingEvaluators
+
+# VM path template for each task's files; this and the two tables below are exposed
+# on every provider instance, so they are read-only views
+_FILE_PLACEMENT_TEMPLATES = MappingProxyType(
+    {
+        "simple_data_transfer": "/home/user/Desktop/{filename}",
+        "basic_data_aggregation": "/home/user/Desktop/{filename}",
+        "simple_calculation_output": "/home/user/Desktop/{filename}",
+    }
+)
+
+# Extra VM directories each task needs before its files are placed
+_DIRECTORIES_TO_CREATE = MappingProxyType(
+    {
+        "simple_data_transfer": (),
+        "basic_data_aggregation": (),
+        "simple_calculation_output": (),
+    }
+)
+
+# Evaluation mode for each task type
+_EVALUATION_MODES = MappingProxyType(
+    {
+        "simple_data_transfer": "compare_table",
+        "basic_data_aggregation": "compare_table",
+        "simple_calculation_output": "compare_table",
+    }
+)
+
+# File creation method for each task type
+_FILE_CREATORS = {
+    "simple_data_transfer": "_create_simple_data_transfer_files",
+    "basic_data_aggregation": "_create_basic_data_aggregation_files",
+    "simple_calculation_output": "_create_simple_calculation_output_files",
+}
+
+# evaluation_data keys holding the expected spreadsheet's (target cell, expected value) for each task type
+_EXPECTED_CELL_KEYS = {
+    "simple_data_transfer": ("target_cell", "expected_value"),
+    "basic_data_aggregation": ("target_cell", "expected_value"),
+    "simple_calculation_output": ("spreadsheet_target_cell", "spreadsheet_expected_value"),
+}
+
+# Column headers of the Level 3 spreadsheet for each domain scenario
+_SCENARIO_HEADERS = {
+    "business_analytics": ("Revenue", "Costs"),
+    "scientific_research": ("Sensor_A", "Sensor_B"),
+    "education_management": ("Test_1", "Test_2"),
+    "inventory_logistics": ("Stock_A", "Stock_B"),
+}
+_UNKNOWN_SCENARIO_HEADERS = ("Income", "Expenses")
+_NO_CONTEXT_HEADERS = ("Column_A", "Column_B")
+
+# Setup step builder method for each task type; Levels 1 and 2 both fetch a text data file into a blank Calc
+_SETUP_BUILDERS = {
+    "simple_data_transfer": "_build_data_file_setup",
+    "basic_data_aggregation": "_build_data_file_setup",
+    "simple_calculation_output": "_build_level3_setup",
+}
+
+
+def _calc_launch_step() -> Dict[str, Any]:
+    """Build the step that opens a blank LibreOffice Calc."""
+    return {"type": "launch", "parameters": {"command": ["libreoffice", "--calc"]}}
+
+
+def _calc_startup_sleep() -> Dict[str, Any]:
+    """Build the pause that lets Calc finish starting."""
+    return {"type": "sleep", "parameters": {"seconds": 10.0}}
 
 
 class TabularDataReportingFileProvider(FileProviderInterface):
@@ -19,26 +91,23 @@ class TabularDataReportingFileProvider(FileProviderInterface):
 
     def __init__(self):
         """Initialize tabular data reporting file provider."""
-        self.supported_tasks = {
-            "simple_data_transfer",
-            "basic_data_aggregation",
-            "simple_calculation_output",
-        }
-        self.file_placement_mapping = {
-            "simple_data_transfer": "/home/user/Desktop/{filename}",
-            "basic_data_aggregation": "/home/user/Desktop/{filename}",
-            "simple_calculation_output": "/home/user/Desktop/{filename}",
-        }
-        self.directory_creation_mapping = {
-            "simple_data_transfer": [],
-            "basic_data_aggregation": [],
-            "simple_calculation_output": [],
+        self.supported_tasks = SUPPORTED_TASK_TYPES
+        self.file_placement_mapping = _FILE_PLACEMENT_TEMPLATES
+        self.directory_creation_mapping = _DIRECTORIES_TO_CREATE
+        # Templates that are a plain prefix followed by "{filename}" resolve by concatenation
+        self._file_prefix = {
+            task_type: template[: -len("{filename}")]
+            for task_type, template in self.file_placement_mapping.items()
+            if template.endswith("{filename}") and template.count("{") == 1
         }
 
     def get_file_placement_path(self, task_type: str, filename: str) -> str:
         """Get the file placement path for a specific task type."""
         if not self.supports_task_type(task_type):
             raise ValueError(f"Unsupported task type: {task_type}")
+        prefix = self._file_prefix.get(task_type)
+        if prefix is not None:
+            return prefix + filename
         path_template = self.file_placement_mapping[task_type]
         return path_template.format(filename=filename)
 
@@ -46,20 +115,17 @@ class TabularDataReportingFileProvider(FileProviderInterface):
         """Get list of directories that need to be created for a task type."""
         if not self.supports_task_type(task_type):
             return []
-        return self.directory_creation_mapping.get(task_type, [])
+        return list(self.directory_creation_mapping.get(task_type, ()))
 
     def create_task_files(self, task_data: Dict[str, Any], task_id: str, temp_dir: str) -> Optional[Dict[str, str]]:
         """Create tabular data reporting specific task files."""
         task_type = task_data.get("task_type")
         if not self.supports_task_type(task_type):
             return None
-        if task_type == "simple_data_transfer":
-            return self._create_simple_data_transfer_files(task_data, task_id, temp_dir)
-        elif task_type == "basic_data_aggregation":
-            return self._create_basic_data_aggregation_files(task_data, task_id, temp_dir)
-        elif task_type == "simple_calculation_output":
-            return self._create_simple_calculation_output_files(task_data, task_id, temp_dir)
-        return None
+        creator = _FILE_CREATORS.get(task_type)
+        if creator is None:
+            return None
+        return getattr(self, creator)(task_data, task_id, temp_dir)
 
     def supports_task_type(self, task_type: str) -> bool:
         """Check if this provider supports the given task type."""
@@ -70,12 +136,9 @@ class TabularDataReportingFileProvider(FileProviderInterface):
         data_content = task_data.get("data_file_content", task_data.get("data_content", "Name,Age,City\nJohn,25,NYC\nJane,30,LA"))
         data_filename = task_data.get("data_filename", f"data_{task_id[:8]}.txt")
         data_file_path = os.path.join(temp_dir, data_filename)
-        with open(data_file_path, "w") as f:
-            f.write(data_content)
+        Path(data_file_path).write_bytes(data_content.encode("utf-8"))
         expected_files = self._create_expected_spreadsheet_file(task_data, task_id, temp_dir, "simple_data_transfer")
-        files_info = {"main_file": data_file_path, "main_filename": data_filename}
-        if expected_files:
-            files_info.update(expected_files)
+        files_info = {"main_file": data_file_path, "main_filename": data_filename, **(expected_files or {})}
         return files_info
 
     def _create_basic_data_aggregation_files(self, task_data: Dict[str, Any], task_id: str, temp_dir: str) -> Dict[str, str]:
@@ -83,12 +146,9 @@ class TabularDataReportingFileProvider(FileProviderInterface):
         numbers_content = task_data.get("data_file_content", task_data.get("numbers_content", "10\n20\n30\n40\n50"))
         data_filename = task_data.get("data_filename", f"numbers_{task_id[:8]}.txt")
         data_file_path = os.path.join(temp_dir, data_filename)
-        with open(data_file_path, "w") as f:
-            f.write(numbers_content)
+        Path(data_file_path).write_bytes(numbers_content.encode("utf-8"))
         expected_files = self._create_expected_spreadsheet_file(task_data, task_id, temp_dir, "basic_data_aggregation")
-        files_info = {"main_file": data_file_path, "main_filename": data_filename}
-        if expected_files:
-            files_info.update(expected_files)
+        files_info = {"main_file": data_file_path, "main_filename": data_filename, **(expected_files or {})}
         return files_info
 
     def _create_simple_calculation_output_files(self, task_data: Dict[str, Any], task_id: str, temp_dir: str) -> Dict[str, str]:
@@ -99,22 +159,14 @@ class TabularDataReportingFileProvider(FileProviderInterface):
         domain_context = task_data.get("domain_context", {})
         if domain_context:
             scenario = domain_context.get("scenario", "business_analytics")
-            if scenario == "business_analytics":
-                headers = ["Revenue", "Costs"]
-            elif scenario == "scientific_research":
-                headers = ["Sensor_A", "Sensor_B"]
-            elif scenario == "education_management":
-                headers = ["Test_1", "Test_2"]
-            elif scenario == "inventory_logistics":
-                headers = ["Stock_A", "Stock_B"]
-            else:
-                headers = ["Income", "Expenses"]
+            headers = _SCENARIO_HEADERS.get(scenario, _UNKNOWN_SCENARIO_HEADERS)
         else:
-            headers = ["Column_A", "Column_B"]
+            headers = _NO_CONTEXT_HEADERS
         column_a_values = spreadsheet_data.get("column_a", [10, 15, 8])
         column_b_values = spreadsheet_data.get("column_b", [25, 30, 15])
         data = {headers[0]: column_a_values, headers[1]: column_b_values}
-        filename = task_data.get("file_name", f"task_data_{task_id[:8]}.xlsx")
+        short_id = task_id[:8]
+        filename = task_data.get("file_name", f"task_data_{short_id}.xlsx")
         file_path = os.path.join(temp_dir, filename)
         try:
             import pandas as pd
@@ -125,25 +177,17 @@ class TabularDataReportingFileProvider(FileProviderInterface):
             print("Warning: pandas not available, creating CSV file for LibreOffice Calc")
             csv_filename = filename.replace(".xlsx", ".csv")
             csv_file_path = os.path.join(temp_dir, csv_filename)
-            with open(csv_file_path, "w") as f:
-                f.write(",".join(headers) + "\n")
-                max_rows = max(len(column_a_values), len(column_b_values))
-                for i in range(max_rows):
-                    row = []
-                    row.append(str(column_a_values[i]) if i < len(column_a_values) else "")
-                    row.append(str(column_b_values[i]) if i < len(column_b_values) else "")
-                    f.write(",".join(row) + "\n")
+            lines = [",".join(headers)]
+            lines.extend(f"{a},{b}" for a, b in zip_longest(column_a_values, column_b_values, fillvalue=""))
+            Path(csv_file_path).write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
             file_path = csv_file_path
             filename = csv_filename
         expected_files = self._create_expected_spreadsheet_file(task_data, task_id, temp_dir, "simple_calculation_output")
-        files_info = {"main_file": file_path, "main_filename": filename}
-        if expected_files:
-            files_info.update(expected_files)
+        files_info = {"main_file": file_path, "main_filename": filename, **(expected_files or {})}
         if "expected_total" in task_data:
-            expected_filename = f"expected_total_{task_id[:8]}.txt"
+            expected_filename = f"expected_total_{short_id}.txt"
             expected_file_path = os.path.join(temp_dir, expected_filename)
-            with open(expected_file_path, "w") as f:
-                f.write(str(task_data["expected_total"]))
+            Path(expected_file_path).write_bytes(str(task_data["expected_total"]).encode("utf-8"))
             files_info["gold_standard_file"] = expected_file_path
             files_info["expected_filename"] = expected_filename
         return files_info
@@ -151,28 +195,21 @@ class TabularDataReportingFileProvider(FileProviderInterface):
     def _create_expected_spreadsheet_file(self, task_data: Dict[str, Any], task_id: str, temp_dir: str, task_type: str) -> Optional[Dict[str, str]]:
         """Create expected spreadsheet file for evaluation."""
         try:
-            from openpyxl import Workbook
+            import xlsxwriter
         except ImportError:
-            print("Warning: openpyxl not available, cannot create expected spreadsheet files")
+            print("Warning: xlsxwriter not available, cannot create expected spreadsheet files")
             return None
         evaluation_data = task_data.get("evaluation_data", {})
-        wb = Workbook()
-        ws = wb.active
-        if task_type == "simple_data_transfer":
-            target_cell = evaluation_data.get("target_cell", "A1")
-            expected_value = evaluation_data.get("expected_value", 0)
-            ws[target_cell] = expected_value
-        elif task_type == "basic_data_aggregation":
-            target_cell = evaluation_data.get("target_cell", "A1")
-            expected_value = evaluation_data.get("expected_value", 0)
-            ws[target_cell] = expected_value
-        elif task_type == "simple_calculation_output":
-            target_cell = evaluation_data.get("spreadsheet_target_cell", "A1")
-            expected_value = evaluation_data.get("spreadsheet_expected_value", 0)
-            ws[target_cell] = expected_value
         expected_filename = "expected_result.xlsx"
         expected_path = os.path.join(temp_dir, expected_filename)
-        wb.save(expected_path)
+        # xlsxwriter streams the single expected cell straight into the archive; keep openpyxl's default sheet name
+        wb = xlsxwriter.Workbook(expected_path, {"in_memory": True})
+        ws = wb.add_worksheet("Sheet")
+        cell_keys = _EXPECTED_CELL_KEYS.get(task_type)
+        if cell_keys is not None:
+            target_cell_key, expected_value_key = cell_keys
+            ws.write(evaluation_data.get(target_cell_key, "A1"), evaluation_data.get(expected_value_key, 0))
+        wb.close()
         return {
             "expected_spreadsheet_file": expected_path,
             "expected_spreadsheet_filename": expected_filename,
@@ -186,16 +223,8 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
 
     def __init__(self):
         """Initialize tabular data reporting config provider."""
-        self.supported_tasks = {
-            "simple_data_transfer",
-            "basic_data_aggregation",
-            "simple_calculation_output",
-        }
-        self.evaluation_mode_mapping = {
-            "simple_data_transfer": "compare_table",
-            "basic_data_aggregation": "compare_table",
-            "simple_calculation_output": "compare_table",
-        }
+        self.supported_tasks = SUPPORTED_TASK_TYPES
+        self.evaluation_mode_mapping = _EVALUATION_MODES
 
     def build_setup_steps(
         self,
@@ -207,13 +236,10 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
         task_type = task_data["task_type"]
         if not self.supports_task_type(task_type):
             return []
-        if task_type == "simple_data_transfer":
-            return self._build_level1_setup(task_data, s3_urls, files_created)
-        elif task_type == "basic_data_aggregation":
-            return self._build_level2_setup(task_data, s3_urls, files_created)
-        elif task_type == "simple_calculation_output":
-            return self._build_level3_setup(task_data, s3_urls, files_created)
-        return []
+        builder = _SETUP_BUILDERS.get(task_type)
+        if builder is None:
+            return []
+        return getattr(self, builder)(task_data, s3_urls, files_created)
 
     def get_evaluation_mode(self, task_type: str, level: int) -> str:
         """Get the evaluation mode for a specific task type and level."""
@@ -225,40 +251,14 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
         """Check if this provider supports the given task type."""
         return task_type in self.supported_tasks
 
-    def _build_level1_setup(
-        self,
-        task_data: Dict[str, Any],
-        s3_urls: Dict[str, str],
-        files_created: Dict[str, str],
-    ) -> List[Dict[str, Any]]:
-        """Build setup steps for Level 1: Simple Data Transfer."""
-        steps = []
-        steps.append(
-            {
-                "type": "download",
-                "parameters": {
-                    "files": [
-                        {
-                            "url": s3_urls["main_file"],
-                            "path": f"/home/user/Desktop/{task_data['data_filename']}",
-                        }
-                    ]
-                },
-            }
-        )
-        steps.append({"type": "launch", "parameters": {"command": ["libreoffice", "--calc"]}})
-        steps.append({"type": "sleep", "parameters": {"seconds": 10.0}})
-        return steps
-
-    def _build_level2_setup(
+    def _build_data_file_setup(
         self,
         task_data: Dict[str, Any],
         s3_urls: Dict[str, str],
         files_created: Dict[str, str],
     ) -> List[Dict[str, Any]]:
-        """Build setup steps for Level 2: Basic Data Aggregation."""
-        steps = []
-        steps.append(
+        """Build setup steps for Levels 1 and 2: download the data file and open a blank Calc."""
+        return [
             {
                 "type": "download",
                 "parameters": {
@@ -269,11 +269,10 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
                         }
                     ]
                 },
-            }
-        )
-        steps.append({"type": "launch", "parameters": {"command": ["libreoffice", "--calc"]}})
-        steps.append({"type": "sleep", "parameters": {"seconds": 10.0}})
-        return steps
+            },
+            _calc_launch_step(),
+            _calc_startup_sleep(),
+        ]
 
     def _build_level3_setup(
         self,
@@ -282,9 +281,8 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
         files_created: Dict[str, str],
     ) -> List[Dict[str, Any]]:
         """Build setup steps for Level 3: Simple Calculation and Output."""
-        steps = []
         main_filename = files_created.get("main_filename", "task_data.xlsx")
-        steps.append(
+        return [
             {
                 "type": "download",
                 "parameters": {
@@ -295,9 +293,7 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
                         }
                     ]
                 },
-            }
-        )
-        steps.append(
+            },
             {
                 "type": "launch",
                 "parameters": {
@@ -308,10 +304,9 @@ class TabularDataReportingConfigProvider(ConfigProviderInterface):
                         f"/home/user/Desktop/{main_filename}",
                     ]
                 },
-            }
-        )
-        steps.append({"type": "sleep", "parameters": {"seconds": 10.0}})
-        return steps
+            },
+            _calc_startup_sleep(),
+        ]
 
 
 class TabularDataReportingEvaluationProvider(EvaluationProviderInterface):
@@ -319,11 +314,7 @@ class TabularDataReportingEvaluationProvider(EvaluationProviderInterface):
 
     def __init__(self):
         """Initialize tabular data reporting evaluation provider."""
-        self.supported_tasks = {
-            "simple_data_transfer",
-            "basic_data_aggregation",
-            "simple_calculation_output",
-        }
+        self.supported_tasks = SUPPORTED_TASK_TYPES
         self.evaluators = TabularDataReportingEvaluators()
 
     def build_evaluator_config(
@@ -337,11 +328,10 @@ class TabularDataReportingEvaluationProvider(EvaluationProviderInterface):
         task_type = task_data.get("task_type")
         if not self.supports_task_type(task_type):
             return {}
-        task_data_with_mode = {**task_data, "evaluation_mode": evaluation_mode}
         if self.evaluators.needs_multi_evaluator(task_type):
-            return self.evaluators.build_multi_evaluator_config(task_type, task_data_with_mode, files_created, s3_urls)
+            return self.evaluators.build_multi_evaluator_config(task_type, task_data, files_created, s3_urls)
         else:
-            return self.evaluators.build_single_evaluator_config(task_type, task_data_with_mode, files_created, s3_urls)
+            return self.evaluators.build_single_evaluator_config(task_type, task_data, files_created, s3_urls)
 
     def supports_task_type(self, task_type: str) -> bool:
         """Check if this provider supports the given task type."""
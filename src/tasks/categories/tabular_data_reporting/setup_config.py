@@ -5,6 +5,13 @@ Contains the logic for building setup configuration steps for tasks.
 
 from typing import Dict, Any, List
 
+# Setup step builder method for each task type; Levels 1 and 2 both fetch a text data file into a blank Calc
+_SETUP_BUILDERS = {
+    "simple_data_transfer": "_build_data_file_setup",
+    "basic_data_aggregation": "_build_data_file_setup",
+    "simple_calculation_output": "_build_level3_setup",
+}
+
 
 class TabularDataReportingSetupConfig:
     """Configuration builder for task setup steps in the tabular data reporting category."""
@@ -30,63 +37,18 @@ class TabularDataReportingSetupConfig:
         Returns:
             List of configuration steps
         """
-        steps = []
-        task_type = task_example["task_type"]
-
-        if task_type == "simple_data_transfer":
-            steps = self._build_level1_setup(task_example, s3_urls, files_created)
-        elif task_type == "basic_data_aggregation":
-            steps = self._build_level2_setup(task_example, s3_urls, files_created)
-        elif task_type == "simple_calculation_output":
-            steps = self._build_level3_setup(task_example, s3_urls, files_created)
-
-        return steps
-
-    def _build_level1_setup(
-        self,
-        task_example: Dict[str, Any],
-        s3_urls: Dict[str, str],
-        files_created: Dict[str, str],
-    ) -> List[Dict[str, Any]]:
-        """Build setup steps for Level 1: Simple Data Transfer."""
-        steps = []
-
-        # Step 1: Create directory
-        directory_path = task_example["directory_path"]
-        steps.append(
-            {
-                "type": "command",
-                "parameters": {"command": ["mkdir", "-p", directory_path]},
-            }
-        )
-
-        # Step 2: Download data file (main file contains the data content)
-        steps.append(
-            {
-                "type": "download",
-                "parameters": {
-                    "files": [
-                        {
-                            "url": s3_urls["main_file"],
-                            "path": f"{directory_path}/{task_example['data_filename']}",
-                        }
-                    ]
-                },
-            }
-        )
-
-        # Step 3: Launch LibreOffice Calc with blank spreadsheet
-        steps.append({"type": "launch", "parameters": {"command": ["libreoffice", "--calc"]}})
-
-        return steps
+        builder = _SETUP_BUILDERS.get(task_example["task_type"])
+        if builder is None:
+            return []
+        return getattr(self, builder)(task_example, s3_urls, files_created)
 
-    def _build_level2_setup(
+    def _build_data_file_setup(
         self,
         task_example: Dict[str, Any],
         s3_urls: Dict[str, str],
         files_created: Dict[str, str],
     ) -> List[Dict[str, Any]]:
-        """Build setup steps for Level 2: Basic Data Aggregation."""
+        """Build setup steps for Levels 1 and 2: Simple Data Transfer and Basic Data Aggregation."""
         steps = []
 
         # Step 1: Create directory
@@ -98,7 +60,7 @@ class TabularDataReportingSetupConfig:
             }
         )
 
-        # Step 2: Download numbers file (main file contains the numbers content)
+        # Step 2: Download data file (main file contains the data or numbers content)
         steps.append(
             {
                 "type": "download",
@@ -3,9 +3,23 @@ Task registry for data analysis category.
 Manages registration and retrieval of all task generators.
 """
 
+import importlib
+import threading
+
 # Global registry for task generators
 TASK_GENERATORS = {}
 
+# Guards lazy loading of the built-in generators against concurrent workers
+_REGISTRY_LOCK = threading.Lock()
+_generators_loaded = False
+
+# Built-in generators as (module, class name), imported the first time they are needed
+_LAZY_MAP = {
+    "simple_data_transfer": (".level1_tasks", "SimpleDataTransferGenerator"),
+    "basic_data_aggregation": (".level2_tasks", "BasicDataAggregationGenerator"),
+    "simple_calculation_output": (".level3_tasks", "SimpleCalculationOutputGenerator"),
+}
+
 
 def register_generator(task_type: str, generator_class):
     """Register a task generator class."""
@@ -15,7 +29,11 @@ def register_generator(task_type: str, generator_class):
 def get_task_generator(task_type: str):
     """Get a task generator instance by task type."""
     if task_type not in TASK_GENERATORS:
-        raise ValueError(f"Unknown task type: {task_type}")
+        if task_type not in _LAZY_MAP:
+            raise ValueError(f"Unknown task type: {task_type}")
+        with _REGISTRY_LOCK:
+            if task_type not in TASK_GENERATORS:
+                _load_generator(task_type)
 
     generator_class = TASK_GENERATORS[task_type]
     return generator_class()
@@ -23,27 +41,29 @@ def get_task_generator(task_type: str):
 
 def get_all_generators():
     """Get all registered task generators as instances."""
+    _ensure_generators_loaded()
     return {task_type: gen_class() for task_type, gen_class in TASK_GENERATORS.items()}
 
 
-def _ensure_generators_loaded():
-    """Ensure all generators are loaded and registered."""
-    if not TASK_GENERATORS:
-        # Import and register Level 1 tasks
-        from .level1_tasks import SimpleDataTransferGenerator
-
-        register_generator("simple_data_transfer", SimpleDataTransferGenerator)
-
-        # Import and register Level 2 tasks
-        from .level2_tasks import BasicDataAggregationGenerator
-
-        register_generator("basic_data_aggregation", BasicDataAggregationGenerator)
-
-        # Import and register Level 3 tasks
-        from .level3_tasks import SimpleCalculationOutputGenerator
+def _load_generator(task_type: str):
+    """Import the level module for a built-in task type and register its generator (caller holds _REGISTRY_LOCK)."""
+    module_path, class_name = _LAZY_MAP[task_type]
+    module = importlib.import_module(module_path, __name__)
+    register_generator(task_type, getattr(module, class_name))
 
-        register_generator("simple_calculation_output", SimpleCalculationOutputGenerator)
 
-
-# Ensure generators are loaded when module is imported
-_ensure_generators_loaded()
+def _ensure_generators_loaded():
+    """Ensure all generators are loaded and registered."""
+    global _generators_loaded
+    if _generators_loaded:
+        return
+    with _REGISTRY_LOCK:
+        if _generators_loaded:
+            return
+
+        for task_type in _LAZY_MAP:
+            if task_type not in TASK_GENERATORS:
+                _load_generator(task_type)
+
+        # Set last, so a true flag means every built-in level is registered
+        _generators_loaded = True
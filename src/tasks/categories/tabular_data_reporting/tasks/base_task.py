@@ -7,6 +7,44 @@ from abc import abstractmethod
 from typing import Dict, Any, List, Optional
 from ...base import BaseTask
 
+# Choice pools for generated names and references
+_DIR_SUFFIXES = ("_folder", "_set", "_collection", "_files")
+_FILE_EXTS = (".txt", ".csv", ".dat")
+_SUFFIX_OPTIONS = ("data", "records", "list", "info", "report")
+_COLS = ("A", "B", "C", "D", "E", "F")
+
+# Presentation patterns for single values and value lists
+_NUMBER_PATTERNS = ("{}", "Value: {}", "Result = {}", "Data: {}", "Number: {}")
+_NUMBER_LIST_PATTERNS = ("{n}", "{n}", "Item: {n}", "Value {i}: {n}")
+
+# Entry lines for formatted_reports; integer values get thousands separators
+_ENTRY_INT_TPL = "Entry {i:02d}: {v:,}"
+_ENTRY_TPL = "Entry {i:02d}: {v}"
+
+# Domain-appropriate verbs used in contextual instructions
+_ACTION_VERBS = {
+    "business_analytics": "analyze and process",
+    "scientific_research": "examine and calculate",
+    "education_management": "evaluate and compute",
+    "inventory_logistics": "count and summarize",
+    "financial_planning": "review and calculate",
+}
+
+# Domain-appropriate directory names for contextual paths
+_DIRECTORY_NAMES = {
+    "business_analytics": ("business_data", "analytics_files", "reports", "sales_data"),
+    "scientific_research": ("research_data", "lab_files", "experiments", "study_data"),
+    "education_management": ("student_data", "grades", "academic_files", "class_records"),
+    "inventory_logistics": ("inventory_data", "warehouse_files", "stock_records", "logistics"),
+    "financial_planning": ("financial_data", "budget_files", "expense_reports", "planning"),
+}
+_DEFAULT_DIRECTORY_NAMES = ("data_files",)
+
+
+def format_data_label(data_type: str) -> str:
+    """Human-readable label for a data type, e.g. "sales_records" -> "Sales Records"."""
+    return data_type.replace("_", " ").title()
+
 
 class TabularDataReportingBaseTask(BaseTask):
     """Base class for tabular data reporting task implementations with enhanced variability."""
@@ -58,6 +96,21 @@ class TabularDataReportingBaseTask(BaseTask):
         "formatted_reports": {"description": "Report-style formatted data", "complexity": "advanced"},
     }
 
+    # Selection pools derived once from the tables above so task generation
+    # does not rebuild key lists or re-read nested dicts for every draw
+    _DOMAIN_KEYS = tuple(DOMAIN_DATA_SCENARIOS)
+    _TEMPLATE_KEYS = tuple(DATA_FORMAT_TEMPLATES)
+    _DOMAIN_FIELDS = {
+        domain: (
+            tuple(info["data_types"]),
+            tuple(info["operations"]),
+            tuple(info["contexts"]),
+            tuple(info["file_prefixes"]),
+            info["value_ranges"],
+        )
+        for domain, info in DOMAIN_DATA_SCENARIOS.items()
+    }
+
     def __init__(self, task_type: str, level: int):
         super().__init__()
         self.task_type = task_type
@@ -94,7 +147,7 @@ class TabularDataReportingBaseTask(BaseTask):
 
     def generate_directory_name(self, prefix: str = "data") -> str:
         """Generate random directory name."""
-        suffix = self.random.choice(["_folder", "_set", "_collection", "_files"])
+        suffix = self.random.choice(_DIR_SUFFIXES)
         number = self.random.randint(1, 50)
         return f"{prefix}{suffix}_{number:02d}"
 
@@ -106,7 +159,7 @@ class TabularDataReportingBaseTask(BaseTask):
     def generate_cell_reference(self, columns: List[str] = None, max_row: int = 10) -> str:
         """Generate random cell reference."""
         if columns is None:
-            columns = ["A", "B", "C", "D", "E", "F"]
+            columns = _COLS
         column = self.random.choice(columns)
         row = self.random.randint(1, max_row)
         return f"{column}{row}"
@@ -121,67 +174,58 @@ class TabularDataReportingBaseTask(BaseTask):
         if seed is not None:
             self.set_seed(seed)
 
+        rnd = self.random
+
         # Select domain and format template for this task instance
-        domain = self.random.choice(list(self.DOMAIN_DATA_SCENARIOS.keys()))
-        format_template = self.random.choice(list(self.DATA_FORMAT_TEMPLATES.keys()))
+        domain = rnd.choice(self._DOMAIN_KEYS)
+        format_template = rnd.choice(self._TEMPLATE_KEYS)
 
         self.current_domain = domain
         self.current_template = format_template
 
-        domain_info = self.DOMAIN_DATA_SCENARIOS[domain]
+        data_types, operations, contexts, file_prefixes, value_ranges = self._DOMAIN_FIELDS[domain]
 
         # Generate domain-specific context
         domain_context = {
             "scenario": domain,
-            "data_type": self.random.choice(domain_info["data_types"]),
-            "operation": self.random.choice(domain_info["operations"]),
-            "context_description": self.random.choice(domain_info["contexts"]),
-            "file_prefix": self.random.choice(domain_info["file_prefixes"]),
-            "value_range": domain_info["value_ranges"],
+            "data_type": rnd.choice(data_types),
+            "operation": rnd.choice(operations),
+            "context_description": rnd.choice(contexts),
+            "file_prefix": rnd.choice(file_prefixes),
+            "value_range": value_ranges,
         }
 
         return {
             "task_type": self.task_type,
             "level": self.level,
-            "seed": seed or self.random.randint(1, 10000),
+            "seed": seed or rnd.randint(1, 10000),
             "domain": domain,
             "format_template": format_template,
             "domain_context": domain_context,
             "evaluation_mode": "compare_table",
             "evaluation_method": "compare_table",
             "file_name": self.generate_domain_filename(domain_context),
-            "example_id": f"L{self.level}_{self.task_type}_{domain}_{self.random.randint(1, 1000)}",
+            "example_id": f"L{self.level}_{self.task_type}_{domain}_{rnd.randint(1, 1000)}",
         }
 
-    def generate_basic_task_structure(self, seed: Optional[int] = None) -> Dict[str, Any]:
-        """Generate basic task structure (backwards compatibility)."""
-        return self.generate_enhanced_task_structure(seed)
+    # Backwards-compatible name for the enhanced structure
+    generate_basic_task_structure = generate_enhanced_task_structure
 
     def format_number_content(self, number: int) -> str:
         """Format number content with random patterns."""
-        patterns = [
-            str(number),
-            f"Value: {number}",
-            f"Result = {number}",
-            f"Data: {number}",
-            f"Number: {number}",
-        ]
-        return self.random.choice(patterns)
+        return self.random.choice(_NUMBER_PATTERNS).format(number)
 
     def format_numbers_list(self, numbers: List[int]) -> str:
         """Format list of numbers with random patterns."""
-        patterns = [
-            "\n".join(str(n) for n in numbers),
-            "\n".join(f"{n}" for n in numbers),
-            "\n".join(f"Item: {n}" for n in numbers),
-            "\n".join(f"Value {i + 1}: {n}" for i, n in enumerate(numbers)),
-        ]
-        return self.random.choice(patterns)
+        pattern = self.random.choice(_NUMBER_LIST_PATTERNS)
+        if pattern == "{n}":
+            return "\n".join(map(str, numbers))
+        return "\n".join(pattern.format(i=i, n=n) for i, n in enumerate(numbers, 1))
 
     def generate_spreadsheet_data(self, rows: int, cols: int = 2) -> Dict[str, List[int]]:
         """Generate data for spreadsheet with specified rows and columns."""
         data = {}
-        column_names = ["A", "B", "C", "D", "E", "F"][:cols]
+        column_names = _COLS[:cols]
 
         for i, col_name in enumerate(column_names):
             data[f"column_{col_name.lower()}"] = [self.generate_random_number(1, 20) for _ in range(rows)]
@@ -191,10 +235,9 @@ class TabularDataReportingBaseTask(BaseTask):
     def generate_domain_filename(self, domain_context: Dict[str, Any]) -> str:
         """Generate domain-appropriate filename."""
         prefix = domain_context["file_prefix"]
-        suffix_options = ["data", "records", "list", "info", "report"]
-        suffix = self.random.choice(suffix_options)
+        suffix = self.random.choice(_SUFFIX_OPTIONS)
         number = self.random.randint(100, 999)
-        extension = self.random.choice([".txt", ".csv", ".dat"])
+        extension = self.random.choice(_FILE_EXTS)
         return f"{prefix}_{suffix}_{number}{extension}"
 
     def generate_contextual_numbers(self, count: int, domain_context: Dict[str, Any], complexity: str = "medium") -> List[int]:
@@ -202,11 +245,16 @@ class TabularDataReportingBaseTask(BaseTask):
         value_ranges = domain_context["value_range"]
         range_info = value_ranges.get(complexity, value_ranges["medium"])
 
+        low, high = range_info
+
         # Handle scientific research with decimals
         if domain_context["scenario"] == "scientific_research" and complexity == "low":
-            return [round(self.random.uniform(range_info[0], range_info[1]), 1) for _ in range(count)]
+            uniform = self.random.uniform
+            return [round(uniform(low, high), 1) for _ in range(count)]
 
-        return [self.random.randint(int(range_info[0]), int(range_info[1])) for _ in range(count)]
+        randint = self.random.randint
+        low, high = int(low), int(high)
+        return [randint(low, high) for _ in range(count)]
 
     def format_data_content(self, data: List[float], domain_context: Dict[str, Any], format_template: str) -> str:
         """Format data content based on domain and template."""
@@ -222,7 +270,7 @@ class TabularDataReportingBaseTask(BaseTask):
 
             elif format_template == "labeled_entries":
                 # Use clear, unambiguous labeling
-                data_label = data_type.replace("_", " ").title()
+                data_label = format_data_label(data_type)
                 return f"Target {data_label}: {target_value}"
 
             elif format_template == "structured_records":
@@ -235,22 +283,21 @@ class TabularDataReportingBaseTask(BaseTask):
         # For multiple values (Level 2+), use the original formatting
         else:
             if format_template == "simple_values":
-                return "\n".join(str(value) for value in data)
+                return "\n".join(map(str, data))
 
             elif format_template == "labeled_entries":
-                labels = [f"{data_type.replace('_', ' ').title()} {i + 1}" for i in range(len(data))]
-                return "\n".join(f"{label}: {value}" for label, value in zip(labels, data))
+                data_label = format_data_label(data_type)
+                return "\n".join(f"{data_label} {i}: {value}" for i, value in enumerate(data, 1))
 
             elif format_template == "structured_records":
-                return "\n".join(f"Record {i + 1} | {data_type}: {value} | Status: Active" for i, value in enumerate(data))
+                return "\n".join(f"Record {i} | {data_type}: {value} | Status: Active" for i, value in enumerate(data, 1))
 
             else:  # formatted_reports
                 header = f"=== {context_desc.title()} Report ==="
-                lines = [header, ""]
-                lines.extend(f"Entry {i + 1:02d}: {value:,}" if isinstance(value, int) else f"Entry {i + 1:02d}: {value}" for i, value in enumerate(data))
-                lines.append(f"\nTotal entries: {len(data)}")
-                lines.append("Note: Use only the values after 'Entry XX:' for calculations")
-                return "\n".join(lines)
+                # Generated lists are homogeneous, so pick the entry template once
+                entry_tpl = _ENTRY_INT_TPL if all(isinstance(value, int) for value in data) else _ENTRY_TPL
+                entries = "\n".join(entry_tpl.format(i=i, v=value) for i, value in enumerate(data, 1))
+                return f"{header}\n\n{entries}\n\nTotal entries: {len(data)}\nNote: Use only the values after 'Entry XX:' for calculations"
 
     def generate_contextual_instruction(self, domain_context: Dict[str, Any], task_specifics: Dict[str, Any]) -> str:
         """Generate instruction text that reflects the domain context."""
@@ -258,16 +305,8 @@ class TabularDataReportingBaseTask(BaseTask):
         context_desc = domain_context["context_description"]
 
         # Use domain-appropriate language
-        action_verbs = {
-            "business_analytics": "analyze and process",
-            "scientific_research": "examine and calculate",
-            "education_management": "evaluate and compute",
-            "inventory_logistics": "count and summarize",
-            "financial_planning": "review and calculate",
-        }
-
         domain = domain_context["scenario"]
-        action = action_verbs.get(domain, "process and calculate")
+        action = _ACTION_VERBS.get(domain, "process and calculate")
 
         return f"Please {action} the {data_type} from the {context_desc} data file."
 
@@ -275,15 +314,7 @@ class TabularDataReportingBaseTask(BaseTask):
         """Generate domain-appropriate directory path."""
         scenario = domain_context["scenario"]
 
-        directory_names = {
-            "business_analytics": ["business_data", "analytics_files", "reports", "sales_data"],
-            "scientific_research": ["research_data", "lab_files", "experiments", "study_data"],
-            "education_management": ["student_data", "grades", "academic_files", "class_records"],
-            "inventory_logistics": ["inventory_data", "warehouse_files", "stock_records", "logistics"],
-            "financial_planning": ["financial_data", "budget_files", "expense_reports", "planning"],
-        }
-
-        dir_options = directory_names.get(scenario, ["data_files"])
+        dir_options = _DIRECTORY_NAMES.get(scenario, _DEFAULT_DIRECTORY_NAMES)
         dir_name = self.random.choice(dir_options)
         number = self.random.randint(1, 20)
 
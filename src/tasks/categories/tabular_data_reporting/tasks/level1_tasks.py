@@ -3,7 +3,7 @@ Level 1 task implementations for data analysis: Simple Data Transfer.
 """
 
 from typing import Dict, Any, Optional
-from .base_task import TabularDataReportingBaseTask
+from .base_task import TabularDataReportingBaseTask, format_data_label
 
 
 class SimpleDataTransferGenerator(TabularDataReportingBaseTask):
@@ -38,7 +38,7 @@ class SimpleDataTransferGenerator(TabularDataReportingBaseTask):
         if format_template == "simple_values":
             value_instruction = "The standalone numeric value from the file should be identified (ignore headers or labels)"
         elif format_template == "labeled_entries":
-            data_label = data_type.replace("_", " ").title()
+            data_label = format_data_label(data_type)
             value_instruction = f"The value labeled 'Target {data_label}' needs to be located"
         elif format_template == "structured_records":
             value_instruction = f"The {data_type} value from the data record should be retrieved"
@@ -3,7 +3,24 @@ Level 2 task implementations for data analysis: Basic Data Aggregation.
 """
 
 from typing import Dict, Any, Optional
-from .base_task import TabularDataReportingBaseTask
+from .base_task import TabularDataReportingBaseTask, format_data_label
+
+# Domain-aware aggregation choices as (operation, description) pairs
+_SCENARIO_OPERATIONS = {
+    "business_analytics": (("SUM", "total revenue"), ("COUNT", "number of records"), ("AVERAGE", "average value")),
+    "scientific_research": (("SUM", "total measurements"), ("COUNT", "sample count"), ("AVERAGE", "mean value")),
+    "education_management": (("SUM", "total points"), ("COUNT", "number of students"), ("AVERAGE", "class average")),
+    "inventory_logistics": (("SUM", "total inventory"), ("COUNT", "item count"), ("AVERAGE", "average stock level")),
+    "financial_planning": (("SUM", "total amount"), ("COUNT", "number of items"), ("AVERAGE", "average cost")),
+}
+_DEFAULT_OPERATIONS = _SCENARIO_OPERATIONS["financial_planning"]
+
+# Expected-result calculation per aggregation operation
+_OPERATION_FUNCS = {
+    "SUM": sum,
+    "COUNT": len,
+    "AVERAGE": lambda numbers: round(sum(numbers) / len(numbers), 2),
+}
 
 
 class BasicDataAggregationGenerator(TabularDataReportingBaseTask):
@@ -32,30 +49,12 @@ class BasicDataAggregationGenerator(TabularDataReportingBaseTask):
         result_cell = self.generate_cell_reference(["D", "E", "F", "G"], 8)  # Expanded range
 
         # Domain-aware operation selection
-        scenario = domain_context["scenario"]
-        if scenario == "business_analytics":
-            operations = [("SUM", "total revenue"), ("COUNT", "number of records"), ("AVERAGE", "average value")]
-        elif scenario == "scientific_research":
-            operations = [("SUM", "total measurements"), ("COUNT", "sample count"), ("AVERAGE", "mean value")]
-        elif scenario == "education_management":
-            operations = [("SUM", "total points"), ("COUNT", "number of students"), ("AVERAGE", "class average")]
-        elif scenario == "inventory_logistics":
-            operations = [("SUM", "total inventory"), ("COUNT", "item count"), ("AVERAGE", "average stock level")]
-        else:  # financial_planning
-            operations = [("SUM", "total amount"), ("COUNT", "number of items"), ("AVERAGE", "average cost")]
-
+        operations = _SCENARIO_OPERATIONS.get(domain_context["scenario"], _DEFAULT_OPERATIONS)
         operation, operation_desc = self.random.choice(operations)
 
         # Calculate expected result
-        if operation == "SUM":
-            expected_result = sum(numbers)
-            operation_instruction = f"determine the {operation_desc}"
-        elif operation == "COUNT":
-            expected_result = len(numbers)
-            operation_instruction = f"determine the {operation_desc}"
-        else:  # AVERAGE
-            expected_result = round(sum(numbers) / len(numbers), 2)
-            operation_instruction = f"determine the {operation_desc}"
+        expected_result = _OPERATION_FUNCS[operation](numbers)
+        operation_instruction = f"determine the {operation_desc}"
 
         # Create contextual instruction with specific guidance about which values to extract
         data_type = domain_context["data_type"]
@@ -64,7 +63,7 @@ class BasicDataAggregationGenerator(TabularDataReportingBaseTask):
         if format_template == "simple_values":
             extract_instruction = "All numeric values from the file need to be gathered (one per line)"
         elif format_template == "labeled_entries":
-            data_label = data_type.replace("_", " ").title()
+            data_label = format_data_label(data_type)
             extract_instruction = f"Only the main data values after the colon should be collected (ignore entry numbers) from each '{data_label}' line"
         elif format_template == "structured_records":
             extract_instruction = f"Only the {data_type} values from each data record should be collected (ignore record numbers and status)"